@@ -1,11 +1,16 @@
 from __future__ import annotations
 from dataclasses import dataclass
+from functools import cache, lru_cache
 from pathlib import Path
 from shutil import which
+import atexit
 import logging
+import queue
 import subprocess
 import tempfile
 import textwrap
+import threading
+import time
 import os
 import ctypes
 from ctypes import wintypes
@@ -24,14 +29,112 @@ MOUSE_MIDDLE_DOWN = 0x20
 MOUSE_MIDDLE_UP = 0x40
 MOUSE_MIDDLE_CLICK = 0x60
 
+_BUTTON_CODES = {
+    'left': MOUSE_LEFT_CLICK,
+    'right': MOUSE_RIGHT_CLICK,
+    'middle': MOUSE_MIDDLE_CLICK,
+}
+
 # Virtual key codes for common keys
 VK_SHIFT = 0x10
 VK_CTRL = 0x11
 VK_ALT = 0x12
 
+# Virtual key codes for keys sent as plain key events in unicode text
+VK_TAB = 0x09
+VK_RETURN = 0x0D
+VK_CAPITAL = 0x14
+
+# GetSystemMetrics indices for the virtual screen
+SM_XVIRTUALSCREEN = 76
+SM_YVIRTUALSCREEN = 77
+SM_CXVIRTUALSCREEN = 78
+SM_CYVIRTUALSCREEN = 79
+
 # Wheel delta constant
 WHEEL_DELTA = 120
 
+# SendInput structures/flags (passed to IbSendInput)
+INPUT_MOUSE = 0
+INPUT_KEYBOARD = 1
+MOUSEEVENTF_MOVE = 0x0001
+MOUSEEVENTF_HWHEEL = 0x1000
+MOUSEEVENTF_VIRTUALDESK = 0x4000
+MOUSEEVENTF_ABSOLUTE = 0x8000
+KEYEVENTF_KEYUP = 0x0002
+KEYEVENTF_UNICODE = 0x0004
+# Upper bound on INPUT events per IbSendInput call when batching text
+TEXT_BATCH_MAX = 512
+
+
+class _POINT(ctypes.Structure):
+    _fields_ = [("x", ctypes.c_long), ("y", ctypes.c_long)]
+
+
+class _MOUSEINPUT(ctypes.Structure):
+    _fields_ = [
+        ("dx", wintypes.LONG),
+        ("dy", wintypes.LONG),
+        ("mouseData", wintypes.DWORD),
+        ("dwFlags", wintypes.DWORD),
+        ("time", wintypes.DWORD),
+        ("dwExtraInfo", ctypes.c_size_t),
+    ]
+
+
+class _KEYBDINPUT(ctypes.Structure):
+    _fields_ = [
+        ("wVk", wintypes.WORD),
+        ("wScan", wintypes.WORD),
+        ("dwFlags", wintypes.DWORD),
+        ("time", wintypes.DWORD),
+        ("dwExtraInfo", ctypes.c_size_t),
+    ]
+
+
+class _HARDWAREINPUT(ctypes.Structure):
+    _fields_ = [
+        ("uMsg", wintypes.DWORD),
+        ("wParamL", wintypes.WORD),
+        ("wParamH", wintypes.WORD),
+    ]
+
+
+class _INPUT_UNION(ctypes.Union):
+    _fields_ = [("mi", _MOUSEINPUT), ("ki", _KEYBDINPUT), ("hi", _HARDWAREINPUT)]
+
+
+class _INPUT(ctypes.Structure):
+    _anonymous_ = ("u",)
+    _fields_ = [("type", wintypes.DWORD), ("u", _INPUT_UNION)]
+
+
+INVALID_FILE_ATTRIBUTES = 0xFFFFFFFF
+
+# Process creation flags for fire-and-forget AHK scripts
+DETACHED_PROCESS = 0x00000008
+CREATE_NO_WINDOW = 0x08000000
+
+
+def _env_flag(name: str) -> bool:
+    return str(os.getenv(name, '0')).lower() in ('1', 'true', 'yes', 'on')
+
+
+# Environment snapshot taken at import; call refresh_env() to re-read
+_ENV_AHK = os.getenv("AUTOHOTKEY_EXE")
+_ENV_IBSIM_DIR = os.getenv("IBSIM_DIR")
+_PF = os.environ.get("ProgramFiles", r"C:\\Program Files")
+_PFX86 = os.environ.get("ProgramFiles(x86)", r"C:\\Program Files (x86)")
+_DEBUG = _env_flag('WINDOWS_MCP_INPUT_DEBUG')
+
+# GetFileAttributesW is a cheaper existence probe than os.stat on Windows
+try:
+    _GetFileAttributesW = ctypes.WinDLL('kernel32', use_last_error=True).GetFileAttributesW
+    _GetFileAttributesW.argtypes = [wintypes.LPCWSTR]
+    _GetFileAttributesW.restype = wintypes.DWORD
+except (AttributeError, OSError):
+    _GetFileAttributesW = None
+
 
 @dataclass
 class BackendInfo:
@@ -40,39 +143,48 @@ class BackendInfo:
     details: str = ""
 
 
+def _exists_fast(p: str | Path) -> bool:
+    if _GetFileAttributesW is None:
+        return os.path.exists(p)
+    return _GetFileAttributesW(str(p)) != INVALID_FILE_ATTRIBUTES
+
+
+# Install layouts under "<ProgramFiles>/AutoHotkey", most likely (v2 64-bit) first
+_AHK_SUBPATHS = (
+    os.path.join("v2", "AutoHotkey64.exe"),
+    "AutoHotkey64.exe",
+    os.path.join("v2", "AutoHotkeyU64.exe"),
+    "AutoHotkeyU64.exe",
+    os.path.join("v2", "AutoHotkey.exe"),
+    "AutoHotkey.exe",
+)
+
+
 def _find_ahk_exe() -> str | None:
-    env = os.getenv("AUTOHOTKEY_EXE")
-    if env and Path(env).exists():
+    # Keyed on PATH too, so `which` results are recomputed when PATH changes
+    return _find_ahk_exe_for(os.environ.get("PATH", ""), _ENV_AHK, _PF, _PFX86)
+
+
+@lru_cache(maxsize=8)
+def _find_ahk_exe_for(path_env: str, env: str | None, pf: str, pfx86: str) -> str | None:
+    if env and _exists_fast(env):
         return env
     for name in ("AutoHotkey64.exe", "AutoHotkeyU64.exe", "AutoHotkey.exe", "autohotkey.exe"):
-        exe = which(name)
+        exe = which(name, path=path_env or None)
         if exe:
             return exe
-    pf = os.environ.get("ProgramFiles", r"C:\\Program Files")
-    pfx86 = os.environ.get("ProgramFiles(x86)", r"C:\\Program Files (x86)")
-    candidates = [
-        Path(pf) / "AutoHotkey" / "v2" / "AutoHotkey64.exe",
-        Path(pf) / "AutoHotkey" / "AutoHotkey64.exe",
-        Path(pf) / "AutoHotkey" / "v2" / "AutoHotkeyU64.exe",
-        Path(pf) / "AutoHotkey" / "AutoHotkeyU64.exe",
-        Path(pf) / "AutoHotkey" / "v2" / "AutoHotkey.exe",
-        Path(pf) / "AutoHotkey" / "AutoHotkey.exe",
-        Path(pfx86) / "AutoHotkey" / "v2" / "AutoHotkey64.exe",
-        Path(pfx86) / "AutoHotkey" / "AutoHotkey64.exe",
-        Path(pfx86) / "AutoHotkey" / "v2" / "AutoHotkeyU64.exe",
-        Path(pfx86) / "AutoHotkey" / "AutoHotkeyU64.exe",
-        Path(pfx86) / "AutoHotkey" / "v2" / "AutoHotkey.exe",
-        Path(pfx86) / "AutoHotkey" / "AutoHotkey.exe",
-    ]
-    for c in candidates:
-        if c.exists():
-            return str(c)
+    for base in (pf, pfx86):
+        for sub in _AHK_SUBPATHS:
+            p = os.path.join(base, "AutoHotkey", sub)
+            if _exists_fast(p):
+                return p
     return None
 
 
-def _ib_candidate_dirs() -> list[Path]:
+@cache
+def _ib_candidate_dirs() -> tuple[Path, ...]:
     here = Path(__file__).resolve()
-    env = os.getenv("IBSIM_DIR")
+    env = _ENV_IBSIM_DIR
     out: list[Path] = []
     if env:
         out.append(Path(env))
@@ -88,25 +200,335 @@ def _ib_candidate_dirs() -> list[Path]:
     # cwd fallback
     out.append(Path.cwd() / "IbInputSimulator" / "Binding.AHK2")
     out.append(Path.cwd() / "IbInputSimulator")
-    return out
+    return tuple(out)
 
 
+@cache
 def _ib_ahk_include_path() -> Path | None:
     for d in _ib_candidate_dirs():
         p = d / "IbInputSimulator.ahk" if d.name == "Binding.AHK2" else d / "Binding.AHK2" / "IbInputSimulator.ahk"
-        if p.exists():
+        if _exists_fast(p):
             return p
     return None
 
 
+@cache
 def _ib_dll_path() -> Path | None:
     for d in _ib_candidate_dirs():
         p = d / "IbInputSimulator.dll" if d.name == "Binding.AHK2" else d / "Binding.AHK2" / "IbInputSimulator.dll"
-        if p.exists():
+        if _exists_fast(p):
             return p
     return None
 
 
+_AHK_KEY_NAME = {
+    'enter': 'Enter', 'return': 'Enter', 'backspace': 'Backspace', 'bs': 'Backspace',
+    'tab': 'Tab', 'esc': 'Escape', 'escape': 'Escape', 'space': 'Space',
+    'home': 'Home', 'end': 'End', 'pgup': 'PgUp', 'pageup': 'PgUp', 'pgdn': 'PgDn', 'pagedown': 'PgDn',
+    'up': 'Up', 'down': 'Down', 'left': 'Left', 'right': 'Right',
+    'shift': 'Shift', 'lshift': 'LShift', 'rshift': 'RShift',
+    'ctrl': 'Ctrl', 'control': 'Ctrl', 'lctrl': 'LCtrl', 'rctrl': 'RCtrl',
+    'alt': 'Alt', 'lalt': 'LAlt', 'ralt': 'RAlt',
+    'win': 'LWin', 'lwin': 'LWin', 'rwin': 'RWin', 'apps': 'AppsKey', 'menu': 'AppsKey',
+}
+
+
+@lru_cache(maxsize=512)
+def _ahk_key_name(key: str) -> str:
+    p = key.strip().lower()
+    if p.startswith('vk') and len(p) >= 4:
+        return 'vk' + p[2:].lstrip('_').upper()
+    if p in _AHK_KEY_NAME:
+        return _AHK_KEY_NAME[p]
+    if p.startswith('f') and p[1:].isdigit():
+        n = int(p[1:])
+        if 1 <= n <= 24:
+            return f'F{n}'
+    return p if len(p) == 1 else p.capitalize()
+
+
+_VK_SPECIAL = {
+    'enter': 0x0D, 'return': 0x0D, 'backspace': 0x08, 'tab': 0x09,
+    'esc': 0x1B, 'escape': 0x1B, 'space': 0x20,
+    'capslock': 0x14, 'caps': 0x14, 'numlock': 0x90, 'scrolllock': 0x91,
+    'pause': 0x13, 'break': 0x13, 'printscreen': 0x2C, 'prtsc': 0x2C, 'prtscr': 0x2C,
+    'insert': 0x2D, 'ins': 0x2D, 'delete': 0x2E, 'del': 0x2E,
+    'home': 0x24, 'end': 0x23, 'pageup': 0x21, 'pgup': 0x21, 'pagedown': 0x22, 'pgdn': 0x22,
+    'up': 0x26, 'down': 0x28, 'left': 0x25, 'right': 0x27,
+    'shift': 0x10, 'lshift': 0xA0, 'rshift': 0xA1,
+    'ctrl': 0x11, 'control': 0x11, 'lctrl': 0xA2, 'rctrl': 0xA3,
+    'alt': 0x12, 'lalt': 0xA4, 'ralt': 0xA5,
+    'win': 0x5B, 'lwin': 0x5B, 'rwin': 0x5C, 'apps': 0x5D, 'menu': 0x5D,
+    'numpad0': 0x60, 'num0': 0x60, 'kp0': 0x60,
+    'numpad1': 0x61, 'num1': 0x61, 'kp1': 0x61,
+    'numpad2': 0x62, 'num2': 0x62, 'kp2': 0x62,
+    'numpad3': 0x63, 'num3': 0x63, 'kp3': 0x63,
+    'numpad4': 0x64, 'num4': 0x64, 'kp4': 0x64,
+    'numpad5': 0x65, 'num5': 0x65, 'kp5': 0x65,
+    'numpad6': 0x66, 'num6': 0x66, 'kp6': 0x66,
+    'numpad7': 0x67, 'num7': 0x67, 'kp7': 0x67,
+    'numpad8': 0x68, 'num8': 0x68, 'kp8': 0x68,
+    'numpad9': 0x69, 'num9': 0x69, 'kp9': 0x69,
+    'numpad*': 0x6A, 'multiply': 0x6A, 'kp_multiply': 0x6A,
+    'numpad+': 0x6B, 'add': 0x6B, 'kp_add': 0x6B,
+    'numpad-': 0x6D, 'subtract': 0x6D, 'kp_subtract': 0x6D,
+    'numpad.': 0x6E, 'decimal': 0x6E, 'kp_decimal': 0x6E,
+    'numpad/': 0x6F, 'divide': 0x6F, 'kp_divide': 0x6F,
+    'numpadenter': 0x0D,
+    'semicolon': 0xBA, ';': 0xBA, 'oem_1': 0xBA,
+    'equals': 0xBB, '=': 0xBB, 'oem_plus': 0xBB,
+    'comma': 0xBC, ',': 0xBC, 'oem_comma': 0xBC,
+    'minus': 0xBD, '-': 0xBD, 'oem_minus': 0xBD,
+    'period': 0xBE, 'dot': 0xBE, '.': 0xBE, 'oem_period': 0xBE,
+    'slash': 0xBF, '/': 0xBF, 'oem_2': 0xBF,
+    'grave': 0xC0, '`': 0xC0, 'backquote': 0xC0, 'oem_3': 0xC0,
+    'leftbracket': 0xDB, '[': 0xDB, 'oem_4': 0xDB,
+    'backslash': 0xDC, '\\': 0xDC, 'oem_5': 0xDC, 'pipe': 0xDC,
+    'rightbracket': 0xDD, ']': 0xDD, 'oem_6': 0xDD,
+    'apostrophe': 0xDE, "'": 0xDE, 'quote': 0xDE, 'oem_7': 0xDE,
+    'oem_8': 0xDF,
+}
+
+
+@lru_cache(maxsize=512)
+def _vk_for_key(key: str) -> int | None:
+    if not isinstance(key, str) or not key:
+        return None
+    k = key.strip().lower()
+    try:
+        if k.startswith('vk'):
+            return int(k[2:].lstrip('_'), 16)
+        if k.startswith('0x'):
+            return int(k, 16)
+    except Exception:
+        pass
+    if k.startswith('f') and k[1:].isdigit():
+        n = int(k[1:])
+        if 1 <= n <= 24:
+            return 0x70 + (n - 1)
+    if k in _VK_SPECIAL:
+        return _VK_SPECIAL[k]
+    if len(k) == 1:
+        ch = k
+        if 'a' <= ch <= 'z':
+            return ord(ch.upper())
+        if '0' <= ch <= '9':
+            return ord(ch)
+    return None
+
+
+# Modifier names accepted in combos, and the press order used by the DLL backend
+_COMBO_MODS = {"ctrl": "ctrl", "control": "ctrl", "alt": "alt", "shift": "shift", "win": "win", "lwin": "win", "rwin": "win"}
+_COMBO_MOD_VKS = (("win", 0x5B), ("ctrl", VK_CTRL), ("alt", VK_ALT), ("shift", VK_SHIFT))
+
+
+@lru_cache(maxsize=256)
+def _parse_combo(combo: str) -> tuple[tuple[int, ...], str | None, int | None]:
+    """Parse 'ctrl+shift+x' into (modifier VKs in press order, key name, key VK or None)."""
+    mods = set()
+    key = None
+    for p in combo.split('+'):
+        p = p.strip().lower()
+        if not p:
+            continue
+        if p in _COMBO_MODS:
+            mods.add(_COMBO_MODS[p])
+        else:
+            key = p
+    mod_vks = tuple(vk for name, vk in _COMBO_MOD_VKS if name in mods)
+    return mod_vks, key, (_vk_for_key(key) if key else None)
+
+
+_AHK_MODS = {"ctrl": "^", "alt": "!", "shift": "+", "win": "#"}
+_AHK_MOD_KEYS = {"^": "{Ctrl}", "!": "{Alt}", "+": "{Shift}", "#": "{LWin}"}
+_AHK_HOTKEY_NAME = {
+    "enter": "Enter", "return": "Enter", "backspace": "Backspace",
+    "delete": "Delete", "insert": "Insert", "tab": "Tab", "esc": "Escape",
+    "escape": "Escape", "space": "Space", "home": "Home", "end": "End",
+    "pgup": "PgUp", "pageup": "PgUp", "pgdn": "PgDn", "pagedown": "PgDn",
+    "up": "Up", "down": "Down", "left": "Left", "right": "Right",
+}
+
+
+@lru_cache(maxsize=256)
+def _ahk_combo(combo: str) -> str:
+    """Translate 'ctrl+c' into an AHK Send sequence like '^c'."""
+    parts = [p.strip().lower() for p in combo.split("+") if p.strip()]
+    mods = []
+    key = None
+    for p in parts:
+        if p in _AHK_MODS:
+            mods.append(_AHK_MODS[p])
+        elif len(p) == 1:
+            key = p
+        else:
+            key = "{" + _AHK_HOTKEY_NAME.get(p, p.capitalize()) + "}"
+    if key is None:
+        key = _AHK_MOD_KEYS.get(mods[-1], "") if mods else ""
+        mods = mods[:-1] if mods else []
+    return "".join(mods) + (key or "")
+
+
+@lru_cache(maxsize=256)
+def _hotkey_body(combo: str) -> tuple[str, bytes]:
+    """Return the AHK Send sequence for a combo and its encoded fallback script body."""
+    ahk_seq = _ahk_combo(combo)
+    body = (
+        "try {\n"
+        f"    IbSend(\"{ahk_seq}\")\n"
+        "} catch e {\n"
+        f"    Send(\"{ahk_seq}\")\n"
+        "}"
+    )
+    return ahk_seq, body.encode("utf-8")
+
+
+_WHEEL = {
+    ("vertical", "up"): "WheelUp",
+    ("vertical", "down"): "WheelDown",
+    ("horizontal", "left"): "WheelLeft",
+    ("horizontal", "right"): "WheelRight",
+}
+
+
+@lru_cache(maxsize=64)
+def _scroll_body(key: str, n: int) -> bytes:
+    body = (
+        "try {\n"
+        "    IbSendMode(1)\n"
+        f"    Send(\"{{{key} {n}}}\")\n"
+        "    IbSendMode(0)\n"
+        "} catch e {\n"
+        "    SendMode \"Input\"\n"
+        f"    Send(\"{{{key} {n}}}\")\n"
+        "}"
+    )
+    return body.encode("utf-8")
+
+
+def refresh_env():
+    """Re-read the cached environment variables and drop path lookups derived from them."""
+    global _ENV_AHK, _ENV_IBSIM_DIR, _PF, _PFX86, _DEBUG
+    _ENV_AHK = os.getenv("AUTOHOTKEY_EXE")
+    _ENV_IBSIM_DIR = os.getenv("IBSIM_DIR")
+    _PF = os.environ.get("ProgramFiles", r"C:\\Program Files")
+    _PFX86 = os.environ.get("ProgramFiles(x86)", r"C:\\Program Files (x86)")
+    _DEBUG = _env_flag('WINDOWS_MCP_INPUT_DEBUG')
+    refresh_paths()
+
+
+def refresh_paths():
+    """Drop cached AutoHotkey/IbInputSimulator lookups so the next backend re-resolves them."""
+    _find_ahk_exe_for.cache_clear()
+    _ib_candidate_dirs.cache_clear()
+    _ib_ahk_include_path.cache_clear()
+    _ib_dll_path.cache_clear()
+    IBSimulatorAHKBackend._resolved = False
+
+
+# Percent-escapes for _host_send arguments, so a tab or newline inside one cannot
+# split the frame and leave later replies paired with the wrong command
+_HOST_ESCAPES = str.maketrans({"%": "%25", "\t": "%09", "\n": "%0A", "\r": "%0D"})
+
+# Command loop for the persistent AHK host. Python writes one tab-separated
+# command per line to stdin and the host answers "ok" or "err <message>".
+_AHK_HOST_LOOP = r'''
+stdin := FileOpen("*", "r", "UTF-8")
+Loop {
+    line := stdin.ReadLine()
+    if (line = "") {
+        if stdin.AtEOF
+            break
+        continue
+    }
+    try {
+        a := StrSplit(line, "`t")
+        if InStr(line, "%")
+            for i, v in a
+                a[i] := _IbHostUnescape(v)
+        _IbHostDispatch(a)
+        FileAppend "ok`n", "*"
+    } catch as e {
+        msg := e is Error ? e.Message : String(e)
+        FileAppend "err " StrReplace(StrReplace(msg, "`r", " "), "`n", " ") "`n", "*"
+    }
+}
+ExitApp
+
+; Inverse of _HOST_ESCAPES on the Python side; %25 goes last
+_IbHostUnescape(v) {
+    v := StrReplace(v, "%09", "`t")
+    v := StrReplace(v, "%0A", "`n")
+    v := StrReplace(v, "%0D", "`r")
+    return StrReplace(v, "%25", "%")
+}
+
+_IbHostDispatch(a) {
+    switch a[1] {
+    case "move":
+        try {
+            IbMouseMove Integer(a[2]), Integer(a[3]), 0
+        } catch {
+            MouseMove Integer(a[2]), Integer(a[3]), 0
+        }
+    case "click":
+        try {
+            IbMouseClick a[2], Integer(a[3]), Integer(a[4]), Integer(a[5]), 0
+        } catch {
+            MouseClick a[2], Integer(a[3]), Integer(a[4]), Integer(a[5]), 0
+        }
+    case "drag":
+        try {
+            IbMouseClickDrag "left", Integer(a[2]), Integer(a[3]), Integer(a[4]), Integer(a[5]), 0
+        } catch {
+            MouseClickDrag "left", Integer(a[2]), Integer(a[3]), Integer(a[4]), Integer(a[5]), 0
+        }
+    case "scroll":
+        try {
+            IbSendMode(1)
+            Send("{" a[2] " " a[3] "}")
+            IbSendMode(0)
+        } catch {
+            SendMode "Input"
+            Send("{" a[2] " " a[3] "}")
+        }
+    case "text":
+        cps := StrSplit(a[2], ",")
+        try {
+            IbSendMode(1)
+            SetKeyDelay 3, 20
+            for cp in cps
+                Send("{Text}" Chr(Integer(cp)))
+            IbSendMode(0)
+        } catch {
+            SendMode "Input"
+            SetKeyDelay 3, 20
+            for cp in cps
+                Send("{Text}" Chr(Integer(cp)))
+        }
+    case "hotkey":
+        try {
+            IbSend(a[2])
+        } catch {
+            Send(a[2])
+        }
+    case "kd", "ku":
+        k := "{" a[2] (a[1] = "kd" ? " down}" : " up}")
+        try {
+            IbSendMode(1)
+            Send(k)
+            IbSendMode(0)
+        } catch {
+            SendMode "Input"
+            Send(k)
+        }
+    default:
+        throw Error("unknown op " a[1])
+    }
+}
+'''
+
+
 class InputBackend:
     def info(self) -> BackendInfo:  # pragma: no cover
         raise NotImplementedError
@@ -121,6 +543,15 @@ class InputBackend:
     def drag(self, x1: int, y1: int, x2: int, y2: int):  # pragma: no cover
         raise NotImplementedError
 
+    def move_batch(self, path, interval_s: float = 0.0):
+        """Move through each (x, y) of path, pausing interval_s between points."""
+        first = True
+        for x, y in path:
+            if not first and interval_s > 0:
+                time.sleep(interval_s)
+            first = False
+            self.move(x, y)
+
     def scroll(self, wheel_times: int, type: str = "vertical", direction: str = "down"):  # pragma: no cover
         raise NotImplementedError
 
@@ -128,6 +559,16 @@ class InputBackend:
     def send_text(self, text: str):  # pragma: no cover
         raise NotImplementedError
 
+    def send_text_ascii(self, text: str):
+        """send_text specialised for pure-ASCII text."""
+        self.send_text(text)
+
+    def send_text_batch(self, text: str):
+        """Type text through virtual-key presses, as few backend calls as the backend allows."""
+        for ch in text:
+            self.key_down(ch)
+            self.key_up(ch)
+
     def hotkey(self, combo: str):  # e.g., "ctrl+c"
         raise NotImplementedError
 
@@ -137,30 +578,79 @@ class InputBackend:
     def key_up(self, key: str):  # pragma: no cover
         raise NotImplementedError
 
+    def press_keys(self, keys):
+        """key_down for each key, in order."""
+        for k in keys:
+            self.key_down(k)
+
+    def release_keys(self, keys):
+        """key_up for each key, in the order given."""
+        for k in keys:
+            self.key_up(k)
+
+    def tap_sequence(self, key: str, n: int, interval_s: float = 0.0, hold_s: float = 0.0):
+        """Tap key n times: hold it hold_s, then wait interval_s before the next tap."""
+        kd, ku, sl = self.key_down, self.key_up, time.sleep
+        for i in range(n):
+            if i and interval_s > 0:
+                sl(interval_s)
+            kd(key)
+            if hold_s > 0:
+                sl(hold_s)
+            ku(key)
+
     def tap(self, key: str):  # pragma: no cover
         self.key_down(key)
         self.key_up(key)
 
 
 class IBSimulatorAHKBackend(InputBackend):
+    # Paths are resolved once per process and shared by every instance
+    _resolved = False
+    _ahk: str | None = None
+    _inc: Path | None = None
+    _dll: Path | None = None
+
     def __init__(self, driver: str = "AnyDriver"):
-        self._ahk = _find_ahk_exe()
-        self._inc = _ib_ahk_include_path()
-        self._dll = _ib_dll_path()
+        if _env_flag('WINDOWS_MCP_INPUT_REFRESH'):
+            refresh_env()
+        cls = type(self)
+        if not cls._resolved:
+            cls._ahk = _find_ahk_exe()
+            cls._inc = _ib_ahk_include_path()
+            cls._dll = _ib_dll_path()
+            cls._resolved = True
         self._driver = driver
-        self._ready = bool(self._ahk and self._inc and self._inc.exists() and self._dll and self._dll.exists())
+        # Include/DLL helpers only return paths that exist
+        self._ready = bool(self._ahk and self._inc and self._dll)
+        # Script header is identical for every command, so build and encode it once
+        self._hdr = self._header().encode("utf-8") if self._ready else b""
+        self._proc: subprocess.Popen | None = None
+        self._replies: queue.Queue[str] = queue.Queue()
+        self._host_path = ""
+        self._host_lock = threading.Lock()
+        self._host_failed = False
+        # One scratch script reused by every _run call (created on first use)
+        self._tf_path = ""
+        self._run_lock = threading.Lock()
+        self._async_proc: subprocess.Popen | None = None
+        self._async_path = ""
+        # Encoded fallback script bodies for repeated key events
+        self._body_cache: dict[tuple[str, str], bytes] = {}
+        if self._ready:
+            atexit.register(self._host_stop)
+            atexit.register(self._remove_script)
+            with self._host_lock:
+                self._host_start()
 
     def info(self) -> BackendInfo:
         details = f"ahk={self._ahk}, include={self._inc}, dll={self._dll}"
         return BackendInfo("IBSimulatorAHK", self._ready, details)
 
-    def _run(self, body: str) -> int:
-        if not self._ready:
-            logger.warning("AHK backend not ready, skipping command")
-            return 1
+    def _header(self) -> str:
         inc_path = str(self._inc)
         dll_path = str(self._dll)
-        hdr = textwrap.dedent(f"""
+        return textwrap.dedent(f"""
         #Requires AutoHotkey v2.0
         #NoTrayIcon
         SetBatchLines -1
@@ -174,33 +664,185 @@ class IBSimulatorAHKBackend(InputBackend):
         CoordMode "Mouse", "Screen"
         CoordMode "Pixel", "Screen"
         """)
-        script = hdr + "\n" + body + "\nExitApp\n"
-        with tempfile.NamedTemporaryFile(prefix="ibsim_", suffix=".ahk", delete=False) as tf:
-            tf.write(script.encode("utf-8"))
-            tf_path = tf.name
+
+    def _host_start(self) -> bool:
+        """Spawn the long-lived AHK host that executes commands read from stdin."""
         try:
-            proc = subprocess.run(
-                [self._ahk, "/ErrorStdOut", tf_path],
-                timeout=6,
-                capture_output=True,
-                text=True
+            fd, self._host_path = tempfile.mkstemp(prefix="ibsim_host_", suffix=".ahk")
+            with os.fdopen(fd, "wb") as f:
+                f.write(self._hdr)
+                f.write(_AHK_HOST_LOOP.encode("utf-8"))
+            self._proc = subprocess.Popen(
+                [self._ahk, "/ErrorStdOut", self._host_path],
+                stdin=subprocess.PIPE,
+                stdout=subprocess.PIPE,
+                stderr=subprocess.DEVNULL,
+                text=True,
+                encoding="utf-8",
+                bufsize=1,
             )
-            if proc.returncode != 0:
-                logger.warning(f"AHK script failed with code {proc.returncode}: {proc.stderr}")
-            return proc.returncode
-        except subprocess.TimeoutExpired:
-            logger.error("AHK script execution timeout (6s)")
-            return 1
         except Exception as e:
-            logger.error(f"Failed to execute AHK script: {e}")
+            logger.warning(f"Failed to start AHK host, using per-call scripts: {e}")
+            self._host_failed = True
+            self._host_stop()
+            return False
+        self._replies = queue.Queue()
+        threading.Thread(target=self._host_reader, args=(self._proc, self._replies), daemon=True).start()
+        return True
+
+    @staticmethod
+    def _host_reader(proc: subprocess.Popen, replies: queue.Queue):
+        for line in proc.stdout:
+            replies.put(line.rstrip("\r\n"))
+        replies.put("")
+
+    def _host_stop(self):
+        proc, self._proc = self._proc, None
+        if proc is not None and proc.poll() is None:
+            try:
+                proc.stdin.close()
+                proc.wait(timeout=1)
+            except Exception:
+                proc.kill()
+        if self._host_path:
+            try:
+                os.remove(self._host_path)
+            except Exception as e:
+                logger.debug(f"Failed to cleanup AHK host script {self._host_path}: {e}")
+            self._host_path = ""
+
+    def _host_send(self, op: str, *args) -> bool:
+        """Dispatch a command to the AHK host. Returns False when the caller should fall back to _run."""
+        if not self._ready:
+            return False
+        with self._host_lock:
+            if self._proc is None or self._proc.poll() is not None:
+                if self._host_failed or not self._host_start():
+                    return False
+            try:
+                # Tabs separate fields and newlines end the frame, so args are escaped
+                self._proc.stdin.write("\t".join((op, *(str(a).translate(_HOST_ESCAPES) for a in args))) + "\n")
+                self._proc.stdin.flush()
+                reply = self._replies.get(timeout=6)
+            except queue.Empty:
+                # The command may still have run; restart the host instead of replaying it
+                logger.error("AHK host command timeout (6s)")
+                self._host_stop()
+                return True
+            except (OSError, ValueError) as e:
+                logger.warning(f"AHK host pipe failed: {e}")
+                self._host_stop()
+                return False
+            if reply == "ok":
+                return True
+            if reply.startswith("err "):
+                logger.warning(f"AHK host command '{op}' failed: {reply[4:]}")
+                return True
+            logger.warning(f"AHK host unavailable, using per-call scripts: {reply or 'exited'}")
+            self._host_failed = True
+            self._host_stop()
+            return False
+
+    def _remove_script(self):
+        self._wait_async()
+        if self._tf_path:
+            try:
+                os.remove(self._tf_path)
+            except Exception as e:
+                logger.debug(f"Failed to cleanup temp AHK file {self._tf_path}: {e}")
+            self._tf_path = ""
+
+    def _run(self, body: str) -> int:
+        return self._run_bytes(body.encode("utf-8"))
+
+    def _run_bytes(self, body: bytes) -> int:
+        if not self._ready:
+            logger.warning("AHK backend not ready, skipping command")
             return 1
-        finally:
+        with self._run_lock:
+            self._wait_async()
             try:
-                os.remove(tf_path)
+                if not self._tf_path:
+                    fd, self._tf_path = tempfile.mkstemp(prefix="ibsim_", suffix=".ahk")
+                    os.close(fd)
+                with open(self._tf_path, "wb") as tf:
+                    tf.write(self._hdr)
+                    tf.write(b"\n")
+                    tf.write(body)
+                    tf.write(b"\nExitApp\n")
+                    tf.truncate()
+                proc = subprocess.run(
+                    [self._ahk, "/ErrorStdOut", self._tf_path],
+                    timeout=6,
+                    capture_output=True,
+                    text=True
+                )
+                if proc.returncode != 0:
+                    logger.warning(f"AHK script failed with code {proc.returncode}: {proc.stderr}")
+                return proc.returncode
+            except subprocess.TimeoutExpired:
+                logger.error("AHK script execution timeout (6s)")
+                return 1
             except Exception as e:
-                logger.debug(f"Failed to cleanup temp AHK file {tf_path}: {e}")
+                logger.error(f"Failed to execute AHK script: {e}")
+                return 1
+
+    def _wait_async(self):
+        proc, self._async_proc = self._async_proc, None
+        path, self._async_path = self._async_path, ""
+        if proc is not None:
+            try:
+                out, _ = proc.communicate(timeout=6)
+            except subprocess.TimeoutExpired:
+                logger.error("AHK script execution timeout (6s)")
+                proc.kill()
+                proc.wait()
+                out = None
+            if proc.returncode not in (0, None) and out is not None:
+                err = out.decode("utf-8", "replace") if out else ""
+                logger.warning(f"AHK script failed with code {proc.returncode}: {err}")
+        if path:
+            # The script deletes itself once loaded; this covers scripts AHK refused to load
+            try:
+                os.remove(path)
+            except FileNotFoundError:
+                pass
+            except OSError as e:
+                logger.debug(f"Failed to cleanup temp AHK file {path}: {e}")
+
+    def _run_async(self, body: str | bytes):
+        """Launch a script without waiting for it; for events whose result is not observed.
+
+        Each script gets its own file and deletes it once loaded. Launches wait for the
+        previous async script so events still reach the driver in order.
+        """
+        if not self._ready:
+            logger.warning("AHK backend not ready, skipping command")
+            return
+        with self._run_lock:
+            self._wait_async()
+            try:
+                fd, tf_path = tempfile.mkstemp(prefix="ibsim_", suffix=".ahk")
+                self._async_path = tf_path
+                with os.fdopen(fd, "wb") as tf:
+                    tf.write(self._hdr)
+                    tf.write(b"\ntry FileDelete(A_ScriptFullPath)\n")
+                    tf.write(body.encode("utf-8") if isinstance(body, str) else body)
+                    tf.write(b"\nExitApp\n")
+                self._async_proc = subprocess.Popen(
+                    [self._ahk, "/ErrorStdOut", tf_path],
+                    stdout=subprocess.PIPE,
+                    stderr=subprocess.STDOUT,
+                    creationflags=CREATE_NO_WINDOW | DETACHED_PROCESS,
+                    close_fds=True,
+                )
+            except Exception as e:
+                logger.error(f"Failed to execute AHK script: {e}")
+                self._wait_async()
 
     def move(self, x: int, y: int):
+        if self._host_send("move", x, y):
+            return
         body = (
             "try {\n"
             f"    IbMouseMove {x}, {y}, 0\n"
@@ -208,10 +850,12 @@ class IBSimulatorAHKBackend(InputBackend):
             f"    MouseMove {x}, {y}, 0\n"
             "}"
         )
-        self._run(body)
+        self._run_async(body)
 
     def click(self, x: int, y: int, button: str = "left", clicks: int = 1):
         btn = button.lower()
+        if self._host_send("click", btn, x, y, clicks):
+            return
         body = (
             "try {\n"
             f"    IbMouseClick \"{btn}\", {x}, {y}, {clicks}, 0\n"
@@ -222,6 +866,8 @@ class IBSimulatorAHKBackend(InputBackend):
         self._run(body)
 
     def drag(self, x1: int, y1: int, x2: int, y2: int):
+        if self._host_send("drag", x1, y1, x2, y2):
+            return
         body = (
             "try {\n"
             f"    IbMouseClickDrag \"left\", {x1}, {y1}, {x2}, {y2}, 0\n"
@@ -233,30 +879,18 @@ class IBSimulatorAHKBackend(InputBackend):
 
     def scroll(self, wheel_times: int, type: str = "vertical", direction: str = "down"):
         n = max(1, int(wheel_times))
-        t = (type or "vertical").lower()
-        d = (direction or "down").lower()
-        key = None
-        if t == "vertical":
-            if d == "up": key = "WheelUp"
-            elif d == "down": key = "WheelDown"
-        elif t == "horizontal":
-            if d == "left": key = "WheelLeft"
-            elif d == "right": key = "WheelRight"
+        key = _WHEEL.get(((type or "vertical").lower(), (direction or "down").lower()))
         if not key:
             return
-        body = (
-            "try {\n"
-            "    IbSendMode(1)\n"
-            f"    Send(\"{{{key} {n}}}\")\n"
-            "    IbSendMode(0)\n"
-            "} catch e {\n"
-            "    SendMode \"Input\"\n"
-            f"    Send(\"{{{key} {n}}}\")\n"
-            "}"
-        )
-        self._run(body)
+        if self._host_send("scroll", key, n):
+            return
+        self._run_async(_scroll_body(key, n))
 
     def send_text(self, text: str):
+        if not text:
+            return
+        if self._host_send("text", ",".join(str(ord(ch)) for ch in text)):
+            return
         # Send character by character with delay for reliability
         # SetKeyDelay adds delay between key down and up
         # Sleep adds delay between characters
@@ -287,108 +921,79 @@ class IBSimulatorAHKBackend(InputBackend):
         self._run(body)
 
     def hotkey(self, combo: str):
-        parts = [p.strip().lower() for p in combo.split("+") if p.strip()]
-        mod_map = {"ctrl": "^", "alt": "!", "shift": "+", "win": "#"}
-        key_name_map = {
-            "enter": "Enter", "return": "Enter", "backspace": "Backspace",
-            "delete": "Delete", "insert": "Insert", "tab": "Tab", "esc": "Escape",
-            "escape": "Escape", "space": "Space", "home": "Home", "end": "End",
-            "pgup": "PgUp", "pageup": "PgUp", "pgdn": "PgDn", "pagedown": "PgDn",
-            "up": "Up", "down": "Down", "left": "Left", "right": "Right",
-        }
-        mods = []
-        key = None
-        for p in parts:
-            if p in mod_map:
-                mods.append(mod_map[p])
-            elif len(p) == 1:
-                key = p
-            else:
-                key = "{" + key_name_map.get(p, p.capitalize()) + "}"
-        if key is None:
-            back_map = {"^": "{Ctrl}", "!": "{Alt}", "+": "{Shift}", "#": "{LWin}"}
-            key = back_map.get(mods[-1], "") if mods else ""
-            mods = mods[:-1] if mods else []
-        ahk_seq = "".join(mods) + (key or "")
-        body = (
-            "try {\n"
-            f"    IbSend(\"{ahk_seq}\")\n"
-            "} catch e {\n"
-            f"    Send(\"{ahk_seq}\")\n"
-            "}"
-        )
-        self._run(body)
-
-    def _ahk_key_name(self, key: str) -> str:
-        p = key.strip().lower()
-        if p.startswith('vk') and len(p) >= 4:
-            return 'vk' + p[2:].lstrip('_').upper()
-        key_name_map = {
-            'enter': 'Enter', 'return': 'Enter', 'backspace': 'Backspace', 'bs': 'Backspace',
-            'tab': 'Tab', 'esc': 'Escape', 'escape': 'Escape', 'space': 'Space',
-            'home': 'Home', 'end': 'End', 'pgup': 'PgUp', 'pageup': 'PgUp', 'pgdn': 'PgDn', 'pagedown': 'PgDn',
-            'up': 'Up', 'down': 'Down', 'left': 'Left', 'right': 'Right',
-            'shift': 'Shift', 'lshift': 'LShift', 'rshift': 'RShift',
-            'ctrl': 'Ctrl', 'control': 'Ctrl', 'lctrl': 'LCtrl', 'rctrl': 'RCtrl',
-            'alt': 'Alt', 'lalt': 'LAlt', 'ralt': 'RAlt',
-            'win': 'LWin', 'lwin': 'LWin', 'rwin': 'RWin', 'apps': 'AppsKey', 'menu': 'AppsKey',
-        }
-        if p in key_name_map:
-            return key_name_map[p]
-        if p.startswith('f') and p[1:].isdigit():
-            n = int(p[1:])
-            if 1 <= n <= 24:
-                return f'F{n}'
-        return p if len(p) == 1 else p.capitalize()
+        ahk_seq, body = _hotkey_body(combo)
+        if self._host_send("hotkey", ahk_seq):
+            return
+        self._run_bytes(body)
+
+    def _key_body(self, k: str, state: str) -> bytes:
+        body = self._body_cache.get((state, k))
+        if body is None:
+            body = self._body_cache[(state, k)] = (
+                "try {\n"
+                "    IbSendMode(1)\n"
+                f"    Send(\"{{{k} {state}}}\")\n"
+                "    IbSendMode(0)\n"
+                "} catch e {\n"
+                "    SendMode \"Input\"\n"
+                f"    Send(\"{{{k} {state}}}\")\n"
+                "}"
+            ).encode("utf-8")
+        return body
 
     def key_down(self, key: str):
-        k = self._ahk_key_name(key)
-        body = (
-            "try {\n"
-            "    IbSendMode(1)\n"
-            f"    Send(\"{{{k} down}}\")\n"
-            "    IbSendMode(0)\n"
-            "} catch e {\n"
-            "    SendMode \"Input\"\n"
-            f"    Send(\"{{{k} down}}\")\n"
-            "}"
-        )
-        self._run(body)
+        k = _ahk_key_name(key)
+        if self._host_send("kd", k):
+            return
+        self._run_async(self._key_body(k, "down"))
 
     def key_up(self, key: str):
-        k = self._ahk_key_name(key)
-        body = (
-            "try {\n"
-            "    IbSendMode(1)\n"
-            f"    Send(\"{{{k} up}}\")\n"
-            "    IbSendMode(0)\n"
-            "} catch e {\n"
-            "    SendMode \"Input\"\n"
-            f"    Send(\"{{{k} up}}\")\n"
-            "}"
-        )
-        self._run(body)
+        k = _ahk_key_name(key)
+        if self._host_send("ku", k):
+            return
+        self._run_async(self._key_body(k, "up"))
+
+
+# Prebuilt hotkey INPUT arrays kept per DLL backend
+_HOTKEY_CACHE_MAX = 256
 
 
 class IBSimulatorDLLBackend(InputBackend):
     def __init__(self, driver: str = "AnyDriver"):
         self._driver = driver
-        self._debug = str(os.getenv('WINDOWS_MCP_INPUT_DEBUG', '0')).lower() in ('1','true','yes','on')
+        self._debug = _DEBUG
         # Configurable text input delays (in seconds)
         # Increased default to 15ms for better reliability with games, remote desktop, etc.
         self._char_delay = float(os.getenv('WINDOWS_MCP_CHAR_DELAY', '0.015'))  # 15ms default
         self._key_delay = float(os.getenv('WINDOWS_MCP_KEY_DELAY', '0.003'))    # 3ms default
+        # VK text paces itself every N chars instead of after each one, then settles once at the end
+        self._char_batch = max(1, int(os.getenv('WINDOWS_MCP_CHAR_BATCH', '8')))
+        self._flush_delay = float(os.getenv('WINDOWS_MCP_FLUSH_DELAY', '0.015'))
+        # 'unicode' sends text as one KEYEVENTF_UNICODE batch; 'vk' keeps the per-char VK path
+        self._text_mode = os.getenv('WINDOWS_MCP_TEXT_MODE', 'unicode').strip().lower()
+        # Opt-in: pure-ASCII unicode-mode text as plain virtual keys (CapsLock/IME sensitive)
+        self._ascii_vk = _env_flag('WINDOWS_MCP_ASCII_VK')
+        self._vk_cache: dict[str, int] = {}
+        self._vk_seq_cache: dict[str, tuple[tuple[int, int], ...]] = {}
+        # combo string -> prebuilt INPUT array (mods down, key down/up, mods up), capped at _HOTKEY_CACHE_MAX
+        self._hotkey_cache: dict[str, ctypes.Array] = {}
         dll_path = _ib_dll_path()
         self._dll_path = str(dll_path) if dll_path else ""
         self._ready = False
         self._err = ""
         try:
-            if not self._dll_path or not Path(self._dll_path).exists():
-                self._err = f"dll not found at {self._dll_path}"
-                logger.error(f"IBSimulator DLL not found: {self._dll_path}")
+            # _ib_dll_path() only returns existing files; LoadLibrary reports anything else
+            if not self._dll_path:
+                self._err = "dll not found"
+                logger.error("IBSimulator DLL not found")
                 return
             logger.info(f"Loading IBSimulator DLL from: {self._dll_path}")
-            self._dll = ctypes.WinDLL(self._dll_path)
+            try:
+                self._dll = ctypes.WinDLL(self._dll_path)
+            except OSError as e:
+                self._err = f"dll load failed: {e}"
+                logger.error(f"Failed to load IBSimulator DLL {self._dll_path}: {e}")
+                return
             self._dll.IbSendInit.argtypes = [ctypes.c_uint32, ctypes.c_uint32, ctypes.c_void_p]
             self._dll.IbSendInit.restype = ctypes.c_uint32
             self._dll.IbSendDestroy.argtypes = []
@@ -424,6 +1029,26 @@ class IBSimulatorDLLBackend(InputBackend):
             self._user32.VkKeyScanW.restype = ctypes.c_short
             self._user32.SetCursorPos.argtypes = [ctypes.c_int, ctypes.c_int]
             self._user32.SetCursorPos.restype = ctypes.c_bool
+            self._user32.GetCursorPos.argtypes = [ctypes.POINTER(_POINT)]
+            self._user32.GetCursorPos.restype = ctypes.c_bool
+            self._user32.GetKeyState.argtypes = [ctypes.c_int]
+            self._user32.GetKeyState.restype = ctypes.c_short
+            self._user32.GetSystemMetrics.argtypes = [ctypes.c_int]
+            self._user32.GetSystemMetrics.restype = ctypes.c_int
+            # Virtual screen geometry used to normalize absolute moves (0..65535)
+            self._vs_left = self._user32.GetSystemMetrics(SM_XVIRTUALSCREEN)
+            self._vs_top = self._user32.GetSystemMetrics(SM_YVIRTUALSCREEN)
+            self._vs_w = max(2, self._user32.GetSystemMetrics(SM_CXVIRTUALSCREEN))
+            self._vs_h = max(2, self._user32.GetSystemMetrics(SM_CYVIRTUALSCREEN))
+            # Bind hot entry points once to skip the CDLL attribute lookup per event
+            self._kd = self._dll.IbSendKeybdDown
+            self._ku = self._dll.IbSendKeybdUp
+            self._mc = self._dll.IbSendMouseClick
+            self._mm = self._dll.IbSendMouseMove
+            self._si = self._dll.IbSendInput
+            self._vks = self._user32.VkKeyScanW
+            self._scp = self._user32.SetCursorPos
+            self._gcp = self._user32.GetCursorPos
             self._ready = True
             logger.info(f"IBSimulator DLL backend initialized successfully with driver: {self._driver}")
         except Exception as e:
@@ -448,36 +1073,98 @@ class IBSimulatorDLLBackend(InputBackend):
         if not self._ready:
             logger.warning("DLL backend not ready, skipping mouse move")
             return
+        if type(x) is not int or type(y) is not int:
+            x, y = int(x), int(y)
+        self._move_unchecked(x, y)
+
+    def _move_unchecked(self, x: int, y: int):
+        """move() for callers that already hold int coordinates and a ready backend."""
         try:
-            xi, yi = int(x), int(y)
-            self._user32.SetCursorPos(xi, yi)
-            class POINT(ctypes.Structure):
-                _fields_ = [("x", ctypes.c_long), ("y", ctypes.c_long)]
-            pt = POINT()
-            self._user32.GetCursorPos(ctypes.byref(pt))
-            dx = xi - int(pt.x)
-            dy = yi - int(pt.y)
+            inp = _INPUT(type=INPUT_MOUSE)
+            inp.mi.dx = (x - self._vs_left) * 65535 // (self._vs_w - 1)
+            inp.mi.dy = (y - self._vs_top) * 65535 // (self._vs_h - 1)
+            inp.mi.dwFlags = MOUSEEVENTF_MOVE | MOUSEEVENTF_ABSOLUTE | MOUSEEVENTF_VIRTUALDESK
+            if self._si(1, ctypes.byref(inp), ctypes.sizeof(_INPUT)):
+                return
+            # Driver rejected the absolute move: position the cursor, then nudge relatively
+            self._scp(x, y)
+            pt = _POINT()
+            self._gcp(ctypes.byref(pt))
+            dx = x - pt.x
+            dy = y - pt.y
             if dx or dy:
-                self._dll.IbSendMouseMove(ctypes.c_uint32(dx & 0xFFFFFFFF).value,
-                                          ctypes.c_uint32(dy & 0xFFFFFFFF).value,
-                                          1)
+                self._mm(dx & 0xFFFFFFFF, dy & 0xFFFFFFFF, 1)
         except Exception as e:
             logger.error(f"Mouse move failed: {e}")
 
+    def move_batch(self, path, interval_s: float = 0.0):
+        if not self._ready:
+            logger.warning("DLL backend not ready, skipping mouse move batch")
+            return
+        n = len(path)
+        if not n:
+            return
+        try:
+            # Pack every waypoint into one INPUT array up front
+            arr = (_INPUT * n)()
+            left, top = self._vs_left, self._vs_top
+            sx, sy = self._vs_w - 1, self._vs_h - 1
+            flags = MOUSEEVENTF_MOVE | MOUSEEVENTF_ABSOLUTE | MOUSEEVENTF_VIRTUALDESK
+            for i, (x, y) in enumerate(path):
+                inp = arr[i]
+                inp.type = INPUT_MOUSE
+                inp.mi.dx = (int(x) - left) * 65535 // sx
+                inp.mi.dy = (int(y) - top) * 65535 // sy
+                inp.mi.dwFlags = flags
+            size = ctypes.sizeof(_INPUT)
+            si = self._si
+            if interval_s <= 0:
+                # Unpaced: the whole path goes to the driver in one call
+                if si(n, arr, size) == n:
+                    return
+                for x, y in path:
+                    self._move_unchecked(int(x), int(y))
+                return
+            base = ctypes.addressof(arr)
+            sleep = time.sleep
+            for i in range(n):
+                if i:
+                    sleep(interval_s)
+                if not si(1, base + i * size, size):
+                    x, y = path[i]
+                    self._move_unchecked(int(x), int(y))
+        except Exception as e:
+            logger.error(f"Mouse move batch failed: {e}")
+
     def click(self, x: int, y: int, button: str = "left", clicks: int = 1):
         if not self._ready:
             logger.warning("DLL backend not ready, skipping mouse click")
             return
+        if type(x) is not int or type(y) is not int:
+            x, y = int(x), int(y)
+        if type(clicks) is not int or clicks < 1:
+            clicks = max(1, int(clicks))
+        self._click_unchecked(x, y, _BUTTON_CODES.get(button.lower(), MOUSE_LEFT_CLICK), clicks)
+
+    def _click_unchecked(self, x: int, y: int, code: int, clicks: int):
+        """click() for callers that already hold ints, a MOUSE_*_CLICK code and clicks >= 1."""
         try:
-            self.move(x, y)
-            btn_map = {
-                'left': MOUSE_LEFT_CLICK,
-                'right': MOUSE_RIGHT_CLICK,
-                'middle': MOUSE_MIDDLE_CLICK
-            }
-            code = btn_map.get(button.lower(), MOUSE_LEFT_CLICK)
-            for _ in range(max(1, int(clicks))):
-                self._dll.IbSendMouseClick(code)
+            self._move_unchecked(x, y)
+            if clicks == 1:
+                self._mc(code)
+                return
+            # Multi-click: one IbSendInput batch of down/up pairs.
+            # The *_CLICK codes are the DOWN|UP MOUSEEVENTF bits; DOWN is the lower bit.
+            down = code & -code
+            up = code & ~down
+            arr = (_INPUT * (2 * clicks))()
+            for i in range(clicks):
+                arr[2 * i].type = arr[2 * i + 1].type = INPUT_MOUSE
+                arr[2 * i].mi.dwFlags = down
+                arr[2 * i + 1].mi.dwFlags = up
+            if not self._si(len(arr), ctypes.byref(arr), ctypes.sizeof(_INPUT)):
+                for _ in range(clicks):
+                    self._mc(code)
         except Exception as e:
             logger.error(f"Mouse click failed: {e}")
 
@@ -486,10 +1173,10 @@ class IBSimulatorDLLBackend(InputBackend):
             logger.warning("DLL backend not ready, skipping mouse drag")
             return
         try:
-            self.move(x1, y1)
-            self._dll.IbSendMouseClick(MOUSE_LEFT_DOWN)
-            self.move(x2, y2)
-            self._dll.IbSendMouseClick(MOUSE_LEFT_UP)
+            self._move_unchecked(int(x1), int(y1))
+            self._mc(MOUSE_LEFT_DOWN)
+            self._move_unchecked(int(x2), int(y2))
+            self._mc(MOUSE_LEFT_UP)
         except Exception as e:
             logger.error(f"Mouse drag failed: {e}")
 
@@ -503,102 +1190,177 @@ class IBSimulatorDLLBackend(InputBackend):
             modifier_vks = [0x10, 0x11, 0x12, 0x5B, 0x5C, 0xA0, 0xA1, 0xA2, 0xA3, 0xA4, 0xA5]
             for vk in modifier_vks:
                 try:
-                    self._dll.IbSendKeybdUp(vk)
+                    self._ku(vk)
                 except Exception:
                     pass
         except Exception as e:
             logger.debug(f"Error releasing modifiers: {e}")
 
-    def _vk_for_key(self, key: str) -> int | None:
-        if not isinstance(key, str) or not key:
-            return None
-        k = key.strip().lower()
-        try:
-            if k.startswith('vk'):
-                return int(k[2:].lstrip('_'), 16)
-            if k.startswith('0x'):
-                return int(k, 16)
-        except Exception:
-            pass
-        if k.startswith('f') and k[1:].isdigit():
-            n = int(k[1:])
-            if 1 <= n <= 24:
-                return 0x70 + (n - 1)
-        special = {
-            'enter': 0x0D, 'return': 0x0D, 'backspace': 0x08, 'tab': 0x09,
-            'esc': 0x1B, 'escape': 0x1B, 'space': 0x20,
-            'capslock': 0x14, 'caps': 0x14, 'numlock': 0x90, 'scrolllock': 0x91,
-            'pause': 0x13, 'break': 0x13, 'printscreen': 0x2C, 'prtsc': 0x2C, 'prtscr': 0x2C,
-            'insert': 0x2D, 'ins': 0x2D, 'delete': 0x2E, 'del': 0x2E,
-            'home': 0x24, 'end': 0x23, 'pageup': 0x21, 'pgup': 0x21, 'pagedown': 0x22, 'pgdn': 0x22,
-            'up': 0x26, 'down': 0x28, 'left': 0x25, 'right': 0x27,
-            'shift': 0x10, 'lshift': 0xA0, 'rshift': 0xA1,
-            'ctrl': 0x11, 'control': 0x11, 'lctrl': 0xA2, 'rctrl': 0xA3,
-            'alt': 0x12, 'lalt': 0xA4, 'ralt': 0xA5,
-            'win': 0x5B, 'lwin': 0x5B, 'rwin': 0x5C, 'apps': 0x5D, 'menu': 0x5D,
-            'numpad0': 0x60, 'num0': 0x60, 'kp0': 0x60,
-            'numpad1': 0x61, 'num1': 0x61, 'kp1': 0x61,
-            'numpad2': 0x62, 'num2': 0x62, 'kp2': 0x62,
-            'numpad3': 0x63, 'num3': 0x63, 'kp3': 0x63,
-            'numpad4': 0x64, 'num4': 0x64, 'kp4': 0x64,
-            'numpad5': 0x65, 'num5': 0x65, 'kp5': 0x65,
-            'numpad6': 0x66, 'num6': 0x66, 'kp6': 0x66,
-            'numpad7': 0x67, 'num7': 0x67, 'kp7': 0x67,
-            'numpad8': 0x68, 'num8': 0x68, 'kp8': 0x68,
-            'numpad9': 0x69, 'num9': 0x69, 'kp9': 0x69,
-            'numpad*': 0x6A, 'multiply': 0x6A, 'kp_multiply': 0x6A,
-            'numpad+': 0x6B, 'add': 0x6B, 'kp_add': 0x6B,
-            'numpad-': 0x6D, 'subtract': 0x6D, 'kp_subtract': 0x6D,
-            'numpad.': 0x6E, 'decimal': 0x6E, 'kp_decimal': 0x6E,
-            'numpad/': 0x6F, 'divide': 0x6F, 'kp_divide': 0x6F,
-            'numpadenter': 0x0D,
-            'semicolon': 0xBA, ';': 0xBA, 'oem_1': 0xBA,
-            'equals': 0xBB, '=': 0xBB, 'oem_plus': 0xBB,
-            'comma': 0xBC, ',': 0xBC, 'oem_comma': 0xBC,
-            'minus': 0xBD, '-': 0xBD, 'oem_minus': 0xBD,
-            'period': 0xBE, 'dot': 0xBE, '.': 0xBE, 'oem_period': 0xBE,
-            'slash': 0xBF, '/': 0xBF, 'oem_2': 0xBF,
-            'grave': 0xC0, '`': 0xC0, 'backquote': 0xC0, 'oem_3': 0xC0,
-            'leftbracket': 0xDB, '[': 0xDB, 'oem_4': 0xDB,
-            'backslash': 0xDC, '\\': 0xDC, 'oem_5': 0xDC, 'pipe': 0xDC,
-            'rightbracket': 0xDD, ']': 0xDD, 'oem_6': 0xDD,
-            'apostrophe': 0xDE, "'": 0xDE, 'quote': 0xDE, 'oem_7': 0xDE,
-            'oem_8': 0xDF,
-        }
-        if k in special:
-            return special[k]
-        if len(k) == 1:
-            ch = k
-            if 'a' <= ch <= 'z':
-                return ord(ch.upper())
-            if '0' <= ch <= '9':
-                return ord(ch)
-        return None
+    def _vk_scan(self, ch: str) -> int:
+        """VkKeyScanW with a per-character cache; the keyboard layout is assumed stable."""
+        vkshort = self._vk_cache.get(ch)
+        if vkshort is None:
+            vkshort = self._vk_cache[ch] = self._vks(ch)
+        return vkshort
 
     def send_text(self, text: str):
         if not self._ready or not text:
             return
-        import time
 
         # Release all modifier keys before starting to prevent state pollution
         # This ensures user's currently pressed keys don't affect input
         self._release_all_modifiers()
 
+        if self._text_mode == 'vk' or not self._send_text_unicode(text):
+            self._send_text_vk(text)
+        if self._flush_delay > 0:
+            time.sleep(self._flush_delay)
+
+    def _send_text_unicode(self, text: str) -> bool:
+        """Send text as one IbSendInput batch of KEYEVENTF_UNICODE down/up pairs.
+
+        Returns False if the driver rejected the whole batch so the caller can use the VK path.
+        """
+        text = text.replace('\r\n', '\n')
+        # UTF-16 code units, so characters outside the BMP become surrogate pairs
+        units = memoryview(text.encode('utf-16-le')).cast('H')
+        arr = (_INPUT * (2 * len(units)))()
+        for i, cu in enumerate(units):
+            down = arr[2 * i]
+            up = arr[2 * i + 1]
+            down.type = up.type = INPUT_KEYBOARD
+            if cu in (0x0A, 0x0D):
+                down.ki.wVk = up.ki.wVk = VK_RETURN
+                up.ki.dwFlags = KEYEVENTF_KEYUP
+            elif cu == 0x09:
+                down.ki.wVk = up.ki.wVk = VK_TAB
+                up.ki.dwFlags = KEYEVENTF_KEYUP
+            else:
+                down.ki.wScan = up.ki.wScan = cu
+                down.ki.dwFlags = KEYEVENTF_UNICODE
+                up.ki.dwFlags = KEYEVENTF_UNICODE | KEYEVENTF_KEYUP
+        # Send the one array in TEXT_BATCH_MAX-event slices by pointer offset,
+        # never splitting a surrogate pair across calls
+        total = len(arr)
+        size = ctypes.sizeof(_INPUT)
+        base = ctypes.addressof(arr)
+        si = self._si
+        sent = 0
+        off = 0
+        while off < total:
+            count = min(TEXT_BATCH_MAX, total - off)
+            end = off + count
+            if end < total and 0xD800 <= units[end // 2 - 1] <= 0xDBFF:
+                count -= 2
+            try:
+                n = si(count, base + off * size, size)
+            except Exception as e:
+                logger.error(f"Unicode text batch failed: {e}")
+                n = 0
+            if n == 0 and off == 0:
+                logger.warning("Unicode text batch rejected by driver, falling back to VK mode")
+                return False
+            sent += n
+            off += count
+        if self._debug:
+            logger.info(f"[send_text] Unicode batch sent {sent}/{total} events")
+        if sent < total:
+            logger.warning(f"Unicode text batch partially sent: {sent}/{total} events")
+        return True
+
+    def _vk_scan_char(self, ch: str) -> int:
+        """VkKeyScanW for ch, with newlines and tabs mapped to their plain keys."""
+        if ch in ('\n', '\r'):
+            return VK_RETURN  # VkKeyScanW maps '\n' to Ctrl+Enter
+        if ch == '\t':
+            return VK_TAB
+        return self._vk_scan(ch)
+
+    def _vk_events(self, ch: str) -> tuple[tuple[int, int], ...]:
+        """(vk, flags) events that type ch with its modifiers; empty if the layout has no key for it."""
+        seq = self._vk_seq_cache.get(ch)
+        if seq is None:
+            vkshort = self._vk_scan_char(ch)
+            if vkshort == -1:
+                seq = ()
+            else:
+                vk = vkshort & 0xFF
+                mods = (vkshort >> 8) & 0xFF
+                held = [m for bit, m in ((0x01, VK_SHIFT), (0x02, VK_CTRL), (0x04, VK_ALT)) if mods & bit]
+                seq = tuple([(m, 0) for m in held] + [(vk, 0), (vk, KEYEVENTF_KEYUP)] + [(m, KEYEVENTF_KEYUP) for m in reversed(held)])
+            self._vk_seq_cache[ch] = seq
+        return seq
+
+    def send_text_batch(self, text: str):
+        """VK-typed text packed into IbSendInput arrays of at most TEXT_BATCH_MAX events."""
+        if not self._ready or not text:
+            return
+        text = text.replace('\r\n', '\n')
+        self._release_all_modifiers()
+        size = ctypes.sizeof(_INPUT)
+        vk_events = self._vk_events
+        events: list[tuple[int, int]] = []  # (vk, flags)
+        start = 0  # first char of the pending batch
+        for idx, ch in enumerate(text):
+            seq = vk_events(ch)
+            if not seq:
+                continue
+            if events and len(events) + len(seq) > TEXT_BATCH_MAX:
+                self._flush_vk_batch(events, size, text[start:idx])
+                events = []
+                start = idx
+            events.extend(seq)
+        if events:
+            self._flush_vk_batch(events, size, text[start:])
+        if self._flush_delay > 0:
+            time.sleep(self._flush_delay)
+
+    def send_text_ascii(self, text: str):
+        # KEYEVENTF_UNICODE stays the default. With WINDOWS_MCP_ASCII_VK=1 the text
+        # goes out as plain virtual keys unless CapsLock is on (Shift+A would type 'a');
+        # characters the current layout cannot type also send it the unicode way
+        if not self._ready or not text:
+            return
+        if self._text_mode == 'vk' or not self._ascii_vk or self._user32.GetKeyState(VK_CAPITAL) & 1:
+            self.send_text(text)
+            return
+        vk_events = self._vk_events
+        for ch in set(text):
+            if not vk_events(ch):
+                self.send_text(text)
+                return
+        self.send_text_batch(text)
+
+    def _flush_vk_batch(self, events: list[tuple[int, int]], size: int, chunk: str):
+        arr = (_INPUT * len(events))()
+        for i, (vk, flags) in enumerate(events):
+            inp = arr[i]
+            inp.type = INPUT_KEYBOARD
+            inp.ki.wVk = vk
+            inp.ki.dwFlags = flags
+        try:
+            if self._si(len(arr), ctypes.byref(arr), size):
+                return
+        except Exception as e:
+            logger.error(f"VK text batch failed: {e}")
+        # Driver rejected the batch: type this chunk key by key
+        self._send_text_vk(chunk)
+
+    def _send_text_vk(self, text: str):
         # Use configurable delays for better performance
-        # Defaults: 15ms between chars, 3ms between key down/up
+        # Defaults: 15ms every 8 chars, 3ms between key down/up
         char_delay = self._char_delay
+        char_batch = self._char_batch
         key_delay = self._key_delay
 
         if self._debug:
-            logger.info(f"[send_text] Starting to send {len(text)} characters: {repr(text)} (char_delay={char_delay}s, key_delay={key_delay}s)")
+            logger.info(f"[send_text] Starting to send {len(text)} characters: {repr(text)} (char_delay={char_delay}s every {char_batch} chars, key_delay={key_delay}s)")
 
-        # Use VK mode exclusively for reliability
-        # Unicode batch mode is disabled due to race condition issues
         for idx, ch in enumerate(text):
             if self._debug:
                 logger.info(f"[send_text] Character {idx}: {repr(ch)}")
 
-            vkshort = self._user32.VkKeyScanW(ch)
+            vkshort = self._vk_scan_char(ch)
             if vkshort == -1:
                 if self._debug:
                     logger.warning(f"[send_text] VkKeyScanW failed for character: {repr(ch)}")
@@ -615,22 +1377,20 @@ class IBSimulatorDLLBackend(InputBackend):
             try:
                 # Press modifiers
                 if mods & 0x01:
-                    self._dll.IbSendKeybdDown(VK_SHIFT)
+                    self._kd(VK_SHIFT)
                     shift_pressed = True
-                    time.sleep(0.001)
                 if mods & 0x02:
-                    self._dll.IbSendKeybdDown(VK_CTRL)
+                    self._kd(VK_CTRL)
                     ctrl_pressed = True
-                    time.sleep(0.001)
                 if mods & 0x04:
-                    self._dll.IbSendKeybdDown(VK_ALT)
+                    self._kd(VK_ALT)
                     alt_pressed = True
-                    time.sleep(0.001)
 
                 # Press and release the key
-                self._dll.IbSendKeybdDown(vk)
-                time.sleep(key_delay)
-                self._dll.IbSendKeybdUp(vk)
+                self._kd(vk)
+                if key_delay > 0:
+                    time.sleep(key_delay)
+                self._ku(vk)
 
                 if self._debug:
                     logger.info(f"[send_text] Character {idx} sent successfully")
@@ -642,25 +1402,23 @@ class IBSimulatorDLLBackend(InputBackend):
                 # Always release modifiers in reverse order, even on error
                 if alt_pressed:
                     try:
-                        time.sleep(0.001)
-                        self._dll.IbSendKeybdUp(VK_ALT)
+                        self._ku(VK_ALT)
                     except Exception:
                         pass
                 if ctrl_pressed:
                     try:
-                        time.sleep(0.001)
-                        self._dll.IbSendKeybdUp(VK_CTRL)
+                        self._ku(VK_CTRL)
                     except Exception:
                         pass
                 if shift_pressed:
                     try:
-                        time.sleep(0.001)
-                        self._dll.IbSendKeybdUp(VK_SHIFT)
+                        self._ku(VK_SHIFT)
                     except Exception:
                         pass
 
-                # Wait before next character
-                time.sleep(char_delay)
+                # Let the target catch up once per batch of characters
+                if char_delay > 0 and (idx + 1) % char_batch == 0:
+                    time.sleep(char_delay)
 
         if self._debug:
             logger.info(f"[send_text] Completed sending all characters")
@@ -670,48 +1428,141 @@ class IBSimulatorDLLBackend(InputBackend):
             logger.warning("DLL backend not ready, skipping hotkey")
             return
         try:
-            parts = [p.strip().lower() for p in combo.split('+') if p.strip()]
-            mods = set(); key = None
-            for p in parts:
-                if p in ("ctrl", "control"): mods.add("ctrl"); continue
-                if p in ("alt",): mods.add("alt"); continue
-                if p in ("shift",): mods.add("shift"); continue
-                if p in ("win", "lwin", "rwin"): mods.add("win"); continue
-                key = p
-            if "win" in mods: self._dll.IbSendKeybdDown(0x5B)
-            if "ctrl" in mods: self._dll.IbSendKeybdDown(0x11)
-            if "alt" in mods: self._dll.IbSendKeybdDown(0x12)
-            if "shift" in mods: self._dll.IbSendKeybdDown(0x10)
+            arr = self._hotkey_cache.get(combo)
+            if arr is None:
+                arr = self._hotkey_inputs(combo)
+            if arr is not None and self._si(len(arr), ctypes.byref(arr), ctypes.sizeof(_INPUT)):
+                return
+            # Not resolvable to a single batch, or the driver rejected it: press key by key
+            mod_vks, key, vk = _parse_combo(combo)
+            for m in mod_vks:
+                self._kd(m)
             if key:
-                vk = self._vk_for_key(key)
-                if vk is None and len(key) == 1:
-                    vkshort = self._user32.VkKeyScanW(key)
-                    vk = vkshort & 0xFF if vkshort != -1 else None
+                if vk is None:
+                    vk = self._resolve_vk(key)
                 if vk is not None:
-                    self._dll.IbSendKeybdDown(vk)
-                    self._dll.IbSendKeybdUp(vk)
+                    self._kd(vk)
+                    self._ku(vk)
                 else:
                     logger.warning(f"Could not resolve virtual key for: {key}")
-            if "shift" in mods: self._dll.IbSendKeybdUp(0x10)
-            if "alt" in mods: self._dll.IbSendKeybdUp(0x12)
-            if "ctrl" in mods: self._dll.IbSendKeybdUp(0x11)
-            if "win" in mods: self._dll.IbSendKeybdUp(0x5B)
+            for m in reversed(mod_vks):
+                self._ku(m)
         except Exception as e:
             logger.error(f"Hotkey '{combo}' failed: {e}")
 
+    def _hotkey_inputs(self, combo: str):
+        """Build (and cache) the INPUT array for combo, or None if its key has no VK."""
+        mod_vks, key, vk = _parse_combo(combo)
+        if key and vk is None:
+            vk = self._resolve_vk(key)
+            if vk is None:
+                return None
+        seq = [(m, 0) for m in mod_vks]
+        if vk is not None:
+            seq += [(vk, 0), (vk, KEYEVENTF_KEYUP)]
+        seq += [(m, KEYEVENTF_KEYUP) for m in reversed(mod_vks)]
+        if not seq:
+            return None
+        arr = (_INPUT * len(seq))()
+        for i, (code, flags) in enumerate(seq):
+            inp = arr[i]
+            inp.type = INPUT_KEYBOARD
+            inp.ki.wVk = code
+            inp.ki.dwFlags = flags
+        cache = self._hotkey_cache
+        if len(cache) >= _HOTKEY_CACHE_MAX:
+            del cache[next(iter(cache))]  # evict the oldest combo
+        cache[combo] = arr
+        return arr
+
+    def _resolve_vk(self, key: str) -> int | None:
+        """VK for a key name, else the layout's key for a single character; None if neither."""
+        vk = _vk_for_key(key)
+        if vk is None and len(key) == 1:
+            vkshort = self._vk_scan(key)
+            vk = vkshort & 0xFF if vkshort != -1 else None
+        return vk
+
+    def _send_keys(self, keys, flags: int) -> bool:
+        """One IbSendInput batch of key events for keys; False if any key is unknown or the driver refuses."""
+        vks = [self._resolve_vk(k) for k in keys]
+        if not vks or None in vks:
+            return False
+        arr = (_INPUT * len(vks))()
+        for i, vk in enumerate(vks):
+            inp = arr[i]
+            inp.type = INPUT_KEYBOARD
+            inp.ki.wVk = vk
+            inp.ki.dwFlags = flags
+        try:
+            return bool(self._si(len(arr), ctypes.byref(arr), ctypes.sizeof(_INPUT)))
+        except Exception as e:
+            logger.error(f"Key batch failed: {e}")
+            return False
+
+    def tap_sequence(self, key: str, n: int, interval_s: float = 0.0, hold_s: float = 0.0):
+        if not self._ready:
+            logger.warning("DLL backend not ready, skipping tap sequence")
+            return
+        vk = self._resolve_vk(key)
+        if vk is None or n < 1:
+            super().tap_sequence(key, n, interval_s, hold_s)
+            return
+        untimed = interval_s <= 0 and hold_s <= 0
+        # Unpaced taps go out as one array of n down/up pairs, paced ones reuse a single pair
+        count = 2 * n if untimed else 2
+        arr = (_INPUT * count)()
+        for i in range(count):
+            inp = arr[i]
+            inp.type = INPUT_KEYBOARD
+            inp.ki.wVk = vk
+            inp.ki.dwFlags = KEYEVENTF_KEYUP if i & 1 else 0
+        size = ctypes.sizeof(_INPUT)
+        si = self._si
+        try:
+            if untimed:
+                if not si(count, ctypes.byref(arr), size):
+                    super().tap_sequence(key, n, interval_s, hold_s)
+                return
+            down = ctypes.addressof(arr)
+            up = down + size
+            sl = time.sleep
+            for i in range(n):
+                if i and interval_s > 0:
+                    sl(interval_s)
+                if not si(1, down, size):
+                    self.key_down(key)
+                if hold_s > 0:
+                    sl(hold_s)
+                if not si(1, up, size):
+                    self.key_up(key)
+        except Exception as e:
+            logger.error(f"Tap sequence '{key}' failed: {e}")
+
+    def press_keys(self, keys):
+        if not self._ready:
+            logger.warning("DLL backend not ready, skipping key press batch")
+            return
+        if not self._send_keys(keys, 0):
+            super().press_keys(keys)
+
+    def release_keys(self, keys):
+        if not self._ready:
+            logger.warning("DLL backend not ready, skipping key release batch")
+            return
+        if not self._send_keys(keys, KEYEVENTF_KEYUP):
+            super().release_keys(keys)
+
     def key_down(self, key: str):
         if not self._ready:
             logger.warning("DLL backend not ready, skipping key down")
             return
         try:
-            vk = self._vk_for_key(key)
-            if vk is None and len(key) == 1:
-                vkshort = self._user32.VkKeyScanW(key)
-                vk = vkshort & 0xFF if vkshort != -1 else None
+            vk = self._resolve_vk(key)
             if vk is None:
                 logger.warning(f"Could not resolve virtual key for key_down: {key}")
                 return
-            self._dll.IbSendKeybdDown(int(vk))
+            self._kd(int(vk))
         except Exception as e:
             logger.error(f"Key down '{key}' failed: {e}")
 
@@ -720,37 +1571,37 @@ class IBSimulatorDLLBackend(InputBackend):
             logger.warning("DLL backend not ready, skipping key up")
             return
         try:
-            vk = self._vk_for_key(key)
-            if vk is None and len(key) == 1:
-                vkshort = self._user32.VkKeyScanW(key)
-                vk = vkshort & 0xFF if vkshort != -1 else None
+            vk = self._resolve_vk(key)
             if vk is None:
                 logger.warning(f"Could not resolve virtual key for key_up: {key}")
                 return
-            self._dll.IbSendKeybdUp(int(vk))
+            self._ku(int(vk))
         except Exception as e:
             logger.error(f"Key up '{key}' failed: {e}")
 
     def scroll(self, wheel_times: int, type: str = "vertical", direction: str = "down"):
         if not self._ready:
             return
-        t = (type or "vertical").lower(); d = (direction or "down").lower()
-        n = max(1, int(wheel_times))
+        t = (type or "vertical").lower()
+        d = (direction or "down").lower()
+        n = wheel_times if isinstance(wheel_times, int) and wheel_times > 0 else max(1, int(wheel_times))
         if t == "vertical":
             delta = WHEEL_DELTA * n
             if d == "down": delta = -delta
             try:
-                self._dll.IbSendMouseWheel(int(delta))
+                self._dll.IbSendMouseWheel(delta)
             except Exception:
                 pass
         elif t == "horizontal":
+            delta = WHEEL_DELTA * n
+            if d == "left":
+                delta = -delta
+            elif d != "right":
+                return
             try:
-                user32 = ctypes.windll.user32
-                MOUSEEVENTF_HWHEEL = 0x01000
-                delta = WHEEL_DELTA * n
-                if d == "left": delta = -delta
-                elif d == "right": delta = +delta
-                else: return
-                user32.mouse_event(MOUSEEVENTF_HWHEEL, 0, 0, int(delta), 0)
+                inp = _INPUT(type=INPUT_MOUSE)
+                inp.mi.mouseData = delta & 0xFFFFFFFF
+                inp.mi.dwFlags = MOUSEEVENTF_HWHEEL
+                self._si(1, ctypes.byref(inp), ctypes.sizeof(_INPUT))
             except Exception:
                 pass
@@ -1,10 +1,15 @@
 import os
+import re
+import threading
+import json
 import logging
 import click
 import ctypes
 from ctypes import wintypes
+from collections import namedtuple
 from contextlib import asynccontextmanager
 from fastmcp import FastMCP
+from time import sleep as _sleep
 from typing import Literal
 
 # Local imports
@@ -18,6 +23,95 @@ from rate import RateLimiter, RateConfig
 
 logger = logging.getLogger(__name__)
 logging.basicConfig(level=os.getenv("WINDOWS_INPUT_LOG_LEVEL", "INFO").upper())
+# Hot tools check this instead of building debug f-strings (info and above are not
+# gated). Read at startup; WINDOWS_MCP_INPUT_REFRESH re-reads it with the other knobs.
+_DEBUG_LOG = logger.isEnabledFor(logging.DEBUG)
+
+
+def _refresh_log_level() -> None:
+    """Re-apply WINDOWS_INPUT_LOG_LEVEL and recompute _DEBUG_LOG."""
+    global _DEBUG_LOG
+    logging.getLogger().setLevel(os.getenv("WINDOWS_INPUT_LOG_LEVEL", "INFO").upper())
+    _DEBUG_LOG = logger.isEnabledFor(logging.DEBUG)
+
+
+# --- Win32 bindings ------------------------------------------------------------
+# Resolved once with explicit prototypes instead of per-call ctypes.windll lookups.
+
+class POINT(ctypes.Structure):
+    _fields_ = [("x", ctypes.c_long), ("y", ctypes.c_long)]
+
+
+# Common RECT structure to avoid duplication
+class RECT(ctypes.Structure):
+    _fields_ = [("left", ctypes.c_long), ("top", ctypes.c_long), ("right", ctypes.c_long), ("bottom", ctypes.c_long)]
+
+
+WNDENUMPROC = ctypes.WINFUNCTYPE(ctypes.c_bool, wintypes.HWND, wintypes.LPARAM)
+
+_user32 = ctypes.WinDLL("user32", use_last_error=True)
+_kernel32 = ctypes.WinDLL("kernel32", use_last_error=True)
+_dwmapi = ctypes.WinDLL("dwmapi")
+
+
+def _bind(dll, name: str, argtypes: list, restype):
+    fn = getattr(dll, name)
+    fn.argtypes = argtypes
+    fn.restype = restype
+    return fn
+
+
+_GetCursorPos = _bind(_user32, "GetCursorPos", [ctypes.POINTER(POINT)], wintypes.BOOL)
+_GetForegroundWindow = _bind(_user32, "GetForegroundWindow", [], wintypes.HWND)
+_GetSystemMetrics = _bind(_user32, "GetSystemMetrics", [ctypes.c_int], ctypes.c_int)
+_EnumWindows = _bind(_user32, "EnumWindows", [WNDENUMPROC, wintypes.LPARAM], wintypes.BOOL)
+_EnumChildWindows = _bind(_user32, "EnumChildWindows", [wintypes.HWND, WNDENUMPROC, wintypes.LPARAM], wintypes.BOOL)
+_IsWindowVisible = _bind(_user32, "IsWindowVisible", [wintypes.HWND], wintypes.BOOL)
+_IsIconic = _bind(_user32, "IsIconic", [wintypes.HWND], wintypes.BOOL)
+_GetWindowTextW = _bind(_user32, "GetWindowTextW", [wintypes.HWND, wintypes.LPWSTR, ctypes.c_int], ctypes.c_int)
+_GetClassNameW = _bind(_user32, "GetClassNameW", [wintypes.HWND, wintypes.LPWSTR, ctypes.c_int], ctypes.c_int)
+_GetWindowRect = _bind(_user32, "GetWindowRect", [wintypes.HWND, ctypes.POINTER(RECT)], wintypes.BOOL)
+_GetWindowThreadProcessId = _bind(_user32, "GetWindowThreadProcessId", [wintypes.HWND, ctypes.POINTER(wintypes.DWORD)], wintypes.DWORD)
+_SetForegroundWindow = _bind(_user32, "SetForegroundWindow", [wintypes.HWND], wintypes.BOOL)
+_BringWindowToTop = _bind(_user32, "BringWindowToTop", [wintypes.HWND], wintypes.BOOL)
+_ShowWindow = _bind(_user32, "ShowWindow", [wintypes.HWND, ctypes.c_int], wintypes.BOOL)
+_SetWindowPos = _bind(
+    _user32, "SetWindowPos",
+    [wintypes.HWND, wintypes.HWND, ctypes.c_int, ctypes.c_int, ctypes.c_int, ctypes.c_int, wintypes.UINT],
+    wintypes.BOOL,
+)
+_PostMessageW = _bind(_user32, "PostMessageW", [wintypes.HWND, wintypes.UINT, wintypes.WPARAM, wintypes.LPARAM], wintypes.BOOL)
+_AttachThreadInput = _bind(_user32, "AttachThreadInput", [wintypes.DWORD, wintypes.DWORD, wintypes.BOOL], wintypes.BOOL)
+_OpenClipboard = _bind(_user32, "OpenClipboard", [wintypes.HWND], wintypes.BOOL)
+_EmptyClipboard = _bind(_user32, "EmptyClipboard", [], wintypes.BOOL)
+_SetClipboardData = _bind(_user32, "SetClipboardData", [wintypes.UINT, wintypes.HANDLE], wintypes.HANDLE)
+_CloseClipboard = _bind(_user32, "CloseClipboard", [], wintypes.BOOL)
+_GlobalAlloc = _bind(_kernel32, "GlobalAlloc", [wintypes.UINT, ctypes.c_size_t], wintypes.HGLOBAL)
+_GlobalLock = _bind(_kernel32, "GlobalLock", [wintypes.HGLOBAL], ctypes.c_void_p)
+_GlobalUnlock = _bind(_kernel32, "GlobalUnlock", [wintypes.HGLOBAL], wintypes.BOOL)
+_GlobalFree = _bind(_kernel32, "GlobalFree", [wintypes.HGLOBAL], wintypes.HGLOBAL)
+_DwmGetWindowAttribute = _bind(_dwmapi, "DwmGetWindowAttribute", [wintypes.HWND, wintypes.DWORD, ctypes.c_void_p, wintypes.DWORD], ctypes.c_long)
+
+
+# ShowWindow / SetWindowPos constants
+SW_MAXIMIZE = 3
+SW_SHOW = 5
+SW_MINIMIZE = 6
+SW_RESTORE = 9
+_SHOW_CMDS = {'restore': SW_RESTORE, 'show': SW_SHOW, 'minimize': SW_MINIMIZE, 'maximize': SW_MAXIMIZE}
+
+HWND_TOP = ctypes.c_void_p(0)
+HWND_BOTTOM = ctypes.c_void_p(1)
+HWND_TOPMOST = ctypes.c_void_p(-1)
+HWND_NOTOPMOST = ctypes.c_void_p(-2)
+_ZMAP = {'topmost': HWND_TOPMOST, 'notopmost': HWND_NOTOPMOST, 'top': HWND_TOP, 'bottom': HWND_BOTTOM}
+
+SWP_NOSIZE = 0x0001
+SWP_NOMOVE = 0x0002
+SWP_NOZORDER = 0x0004
+SWP_SHOWWINDOW = 0x0040
+
+_NUM_RE = re.compile(r"-?\d+")
 
 
 def _coerce_xy(value) -> tuple[int, int]:
@@ -29,27 +123,49 @@ def _coerce_xy(value) -> tuple[int, int]:
     - string forms like "800,600", "800 600", "[800,600]"
     Raises ValueError for invalid inputs.
     """
-    # List/Tuple
-    if isinstance(value, (list, tuple)) and len(value) == 2:
-        return int(value[0]), int(value[1])
+    tp = type(value)
+    # List/Tuple: the shape MCP clients send most, checked by exact type first
+    if tp is list or tp is tuple:
+        if len(value) == 2:
+            x, y = value
+            if type(x) is int and type(y) is int:
+                return x, y
+            return int(x), int(y)
     # Dict with x/y
-    if isinstance(value, dict) and "x" in value and "y" in value:
-        return int(value["x"]), int(value["y"])
+    elif tp is dict:
+        x = value.get("x")
+        y = value.get("y")
+        if x is not None and y is not None:
+            return int(x), int(y)
     # String variants
-    if isinstance(value, str):
+    elif tp is str:
         s = value.strip()
-        if s.startswith("[") and s.endswith("]"):
+        if s[:1] == "[":
             try:
-                import json
                 v = json.loads(s)
-                if isinstance(v, list) and len(v) == 2:
+                if type(v) is list and len(v) == 2:
                     return int(v[0]), int(v[1])
             except Exception:
                 pass
-        import re
-        nums = re.findall(r"-?\d+", s)
+        elif "_" not in s:
+            # Common "x,y" / "x y" forms without touching the regex engine; int()
+            # would accept "1_000", which the regex reads as separate numbers
+            parts = s.replace(",", " ").split()
+            if len(parts) >= 2:
+                try:
+                    return int(parts[0]), int(parts[1])
+                except ValueError:
+                    pass
+        nums = _NUM_RE.findall(s)
         if len(nums) >= 2:
             return int(nums[0]), int(nums[1])
+    # Subclasses of the accepted containers take the slow road through the base type
+    elif isinstance(value, (list, tuple)):
+        return _coerce_xy(list(value))
+    elif isinstance(value, dict):
+        return _coerce_xy(dict(value))
+    elif isinstance(value, str):
+        return _coerce_xy(str(value))
     raise ValueError("Location must be two integers [x,y]")
 
 
@@ -59,6 +175,8 @@ def _backend_from_env() -> InputBackend:
     Prefers DLL backend and falls back to AHK when explicitly selected.
     Does not fall back to PyAutoGUI to guarantee driver-level injection.
     """
+    if os.getenv("WINDOWS_MCP_INPUT_REFRESH", "0").strip().lower() in ("1", "true", "yes", "on"):
+        _refresh_log_level()
     preferred = (os.getenv("WINDOWS_MCP_INPUT_BACKEND", "ibsim-dll") or "").lower()
     driver = os.getenv("WINDOWS_MCP_INPUT_DRIVER", "AnyDriver")
 
@@ -94,8 +212,21 @@ def _backend_from_env() -> InputBackend:
     raise RuntimeError(f"Unsupported WINDOWS_MCP_INPUT_BACKEND={preferred}. Use 'ibsim-dll' or 'ibsim-ahk'.")
 
 
-# Initialize backend and rate limiter at process start
-backend: InputBackend = _backend_from_env()
+# The backend (DLL load / AHK host) is created on the first tool call, not at import
+_backend_singleton: InputBackend | None = None
+_backend_lock = threading.Lock()
+
+
+def get_backend() -> InputBackend:
+    global _backend_singleton
+    b = _backend_singleton
+    if b is None:
+        with _backend_lock:
+            b = _backend_singleton
+            if b is None:
+                b = _backend_singleton = _backend_from_env()
+    return b
+
 
 rate = RateLimiter(
     RateConfig(
@@ -104,9 +235,21 @@ rate = RateLimiter(
         mouse_smooth=float(os.getenv("WINDOWS_MCP_RATE_SMOOTH", "0.0")),
         clicks_per_sec=float(os.getenv("WINDOWS_MCP_RATE_CPS", "8.0")),
         keys_per_sec=float(os.getenv("WINDOWS_MCP_RATE_KPS", "12.0")),
+        burst_clicks=int(os.getenv("WINDOWS_MCP_RATE_BURST_CLICKS", "1")),
+        burst_keys=int(os.getenv("WINDOWS_MCP_RATE_BURST_KEYS", "1")),
+        burst_moves=int(os.getenv("WINDOWS_MCP_RATE_BURST_MOVES", "1")),
     )
 )
 
+# Values the Literal-typed tool arguments already guarantee; anything else is normalised
+_BTNS = frozenset(('left', 'right', 'middle'))
+_METHODS = frozenset(('unicode', 'clipboard', 'vk'))
+_KEY_MODES = frozenset(('tap', 'down', 'up', 'hold'))
+
+# When injected moves land where we put them, Move-Tool plans its path up front
+# instead of polling GetCursorPos between steps
+MOUSE_AUTHORITATIVE = os.getenv("WINDOWS_MCP_MOUSE_AUTHORITATIVE", "1").strip().lower() not in ("0", "false", "no", "off")
+
 
 @asynccontextmanager
 async def lifespan(app: FastMCP):
@@ -144,6 +287,103 @@ mcp = FastMCP(name="windows-input-mcp", instructions=instructions, lifespan=life
 # Some MCP clients (e.g., Claude Desktop) surface prompts/resources explicitly.
 # We register a few practical prompts and read-only resources to improve UX.
 
+def _prompt_messages(system: str, user: str) -> list[dict]:
+    return [
+        {"role": "system", "content": system},
+        {"role": "user", "content": user},
+    ]
+
+
+def prompt_click(loc: str, button: str = "left", clicks: int = 1):
+    return _prompt_messages("Use Click-Tool for driver-level clicking.", f"Call Click-Tool with loc='{loc}', button='{button}', clicks={int(clicks)}")
+
+
+def prompt_type(text: str, method: str = "unicode"):
+    return _prompt_messages("Use Type-Tool for text input.", f"Call Type-Tool with text='{text}', method='{method}'")
+
+
+def prompt_shortcut(shortcut: str):
+    return _prompt_messages("Use Shortcut-Tool for combos.", f"Call Shortcut-Tool with shortcut='{shortcut}'")
+
+
+def prompt_activate_window(query: str = "", index: int | None = None):
+    idx_part = " first match" if index is None else f" index={int(index)}"
+    return _prompt_messages(
+        "Use Windows-List then Windows-Select, then Windows-Activate.",
+        f"List windows with query='{query}'. Select{idx_part}, then activate.",
+    )
+
+
+def prompt_drag(from_loc: str, to_loc: str):
+    return _prompt_messages("Use Drag-Tool for driver-level dragging.", f"Call Drag-Tool with from_loc='{from_loc}', to_loc='{to_loc}'")
+
+
+# (name, description, handler, [(arg, type, required)], system, user template for add_prompt)
+_PROMPTS = [
+    ("Click-At", "Click at coordinates using Click-Tool.", prompt_click,
+     [("loc", "string", True), ("button", "string", False), ("clicks", "number", False)],
+     "Use Click-Tool.", "Call Click-Tool with loc={{loc}} button={{button}} clicks={{clicks}}"),
+    ("Type-Text", "Type text via driver-level injection.", prompt_type,
+     [("text", "string", True), ("method", "string", False)],
+     "Use Type-Tool.", "Call Type-Tool with text={{text}} method={{method}}"),
+    ("Send-Shortcut", "Send a keyboard shortcut like 'ctrl+c' or 'win+r'.", prompt_shortcut,
+     [("shortcut", "string", True)],
+     "Use Shortcut-Tool for combos.", "Call Shortcut-Tool with shortcut={{shortcut}}"),
+    ("Activate-Window", "List/select a window and activate it.", prompt_activate_window,
+     [("query", "string", False), ("index", "number", False)],
+     "Use Windows-List then Windows-Select, then Windows-Activate.", "List windows with query={{query}}. Select index={{index}}, then activate."),
+    ("Drag-From-To", "Drag from one point to another.", prompt_drag,
+     [("from_loc", "string", True), ("to_loc", "string", True)],
+     "Use Drag-Tool for driver-level dragging.", "Call Drag-Tool with from_loc={{from_loc}} to_loc={{to_loc}}"),
+]
+
+
+_ENV_KEYS = (
+    "WINDOWS_MCP_INPUT_BACKEND",
+    "WINDOWS_MCP_INPUT_DRIVER",
+    "WINDOWS_MCP_RATE_MOVE_HZ",
+    "WINDOWS_MCP_RATE_MAX_DELTA",
+    "WINDOWS_MCP_RATE_SMOOTH",
+    "WINDOWS_MCP_RATE_CPS",
+    "WINDOWS_MCP_RATE_KPS",
+    "WINDOWS_MCP_RATE_BURST_CLICKS",
+    "WINDOWS_MCP_RATE_BURST_KEYS",
+    "WINDOWS_MCP_RATE_BURST_MOVES",
+    "WINDOWS_MCP_MOUSE_AUTHORITATIVE",
+    "WINDOWS_INPUT_LOG_LEVEL",
+)
+
+
+def res_desktop_info() -> str:
+    return desktop_info()
+
+
+def res_active_window() -> str:
+    return window_info()
+
+
+def res_rate() -> str:
+    return input_info()
+
+
+def res_instructions() -> str:
+    return instructions
+
+
+def res_env() -> str:
+    return "\n".join(f"{k}={os.getenv(k, '')}" for k in _ENV_KEYS)
+
+
+# (uri, name, description, handler)
+_RESOURCES = [
+    ("mcp://windows/desktop-info", "Desktop Info", "Virtual screen and monitors", res_desktop_info),
+    ("mcp://windows/active-window", "Active Window", "Title/class/rect of foreground window", res_active_window),
+    ("mcp://windows/rate", "Input Rate", "Backend + rate limiter settings", res_rate),
+    ("mcp://windows/instructions", "Server Instructions", "Usage tips and examples", res_instructions),
+    ("mcp://windows/env", "Runtime Env", "Relevant WINDOWS_MCP_* environment variables", res_env),
+]
+
+
 def _register_prompts_and_resources() -> None:
     """Register MCP prompts and resources with graceful fallback.
 
@@ -153,123 +393,49 @@ def _register_prompts_and_resources() -> None:
     # Prompts: provide guided starters for common actions
     try:
         if hasattr(mcp, "prompt"):
-            # Click at point
-            @mcp.prompt(name="Click-At", description="Click at coordinates using Click-Tool.")
-            def prompt_click(loc: str, button: str = "left", clicks: int = 1):
-                return [
-                    {"role": "system", "content": "Use Click-Tool for driver-level clicking."},
-                    {"role": "user", "content": f"Call Click-Tool with loc='{loc}', button='{button}', clicks={int(clicks)}"},
-                ]
-
-            # Type text
-            @mcp.prompt(name="Type-Text", description="Type text via driver-level injection.")
-            def prompt_type(text: str, method: str = "unicode"):
-                return [
-                    {"role": "system", "content": "Use Type-Tool for text input."},
-                    {"role": "user", "content": f"Call Type-Tool with text='{text}', method='{method}'"},
-                ]
-
-            # Shortcut
-            @mcp.prompt(name="Send-Shortcut", description="Send a keyboard shortcut like 'ctrl+c' or 'win+r'.")
-            def prompt_shortcut(shortcut: str):
-                return [
-                    {"role": "system", "content": "Use Shortcut-Tool for combos."},
-                    {"role": "user", "content": f"Call Shortcut-Tool with shortcut='{shortcut}'"},
-                ]
-
-            # Activate window by query or index
-            @mcp.prompt(name="Activate-Window", description="List/select a window and activate it.")
-            def prompt_activate_window(query: str = "", index: int | None = None):
-                idx_part = " first match" if index is None else f" index={int(index)}"
-                return [
-                    {"role": "system", "content": "Use Windows-List then Windows-Select, then Windows-Activate."},
-                    {"role": "user", "content": f"List windows with query='{query}'. Select{idx_part}, then activate."},
-                ]
-
-            # Drag operation
-            @mcp.prompt(name="Drag-From-To", description="Drag from one point to another.")
-            def prompt_drag(from_loc: str, to_loc: str):
-                return [
-                    {"role": "system", "content": "Use Drag-Tool for driver-level dragging."},
-                    {"role": "user", "content": f"Call Drag-Tool with from_loc='{from_loc}', to_loc='{to_loc}'"},
-                ]
+            for name, description, fn, _args, _system, _user in _PROMPTS:
+                mcp.prompt(name=name, description=description)(fn)
         elif hasattr(mcp, "add_prompt"):
             # Fallback builder-style registration (single-message prompts)
-            try:
-                mcp.add_prompt(
-                    name="Click-At",
-                    description="Click at coordinates using Click-Tool.",
-                    arguments=[
-                        {"name": "loc", "type": "string", "required": True},
-                        {"name": "button", "type": "string", "required": False},
-                        {"name": "clicks", "type": "number", "required": False},
-                    ],
-                    messages=[
-                        {"role": "system", "content": "Use Click-Tool."},
-                        {"role": "user", "content": "Call Click-Tool with loc={{loc}} button={{button}} clicks={{clicks}}"},
-                    ],
-                )
-            except Exception:
-                pass
-            try:
-                mcp.add_prompt(
-                    name="Type-Text",
-                    description="Type text via driver-level injection.",
-                    arguments=[
-                        {"name": "text", "type": "string", "required": True},
-                        {"name": "method", "type": "string", "required": False},
-                    ],
-                    messages=[
-                        {"role": "system", "content": "Use Type-Tool."},
-                        {"role": "user", "content": "Call Type-Tool with text={{text}} method={{method}}"},
-                    ],
-                )
-            except Exception:
-                pass
+            for name, description, _fn, args, system, user in _PROMPTS:
+                try:
+                    mcp.add_prompt(
+                        name=name,
+                        description=description,
+                        arguments=[{"name": a, "type": t, "required": r} for a, t, r in args],
+                        messages=[
+                            {"role": "system", "content": system},
+                            {"role": "user", "content": user},
+                        ],
+                    )
+                except Exception:
+                    pass
     except Exception as e:
         logger.debug("Prompt registration skipped: %s", e)
 
     # Resources: read-only helpful views powered by existing tools
     try:
         if hasattr(mcp, "resource"):
-            @mcp.resource(uri="mcp://windows/desktop-info", name="Desktop Info", description="Virtual screen and monitors")
-            def res_desktop_info() -> str:
-                return desktop_info()
-
-            @mcp.resource(uri="mcp://windows/active-window", name="Active Window", description="Title/class/rect of foreground window")
-            def res_active_window() -> str:
-                return window_info()
-
-            @mcp.resource(uri="mcp://windows/rate", name="Input Rate", description="Backend + rate limiter settings")
-            def res_rate() -> str:
-                return input_info()
-
-            @mcp.resource(uri="mcp://windows/instructions", name="Server Instructions", description="Usage tips and examples")
-            def res_instructions() -> str:
-                return instructions
-
-            @mcp.resource(uri="mcp://windows/env", name="Runtime Env", description="Relevant WINDOWS_MCP_* environment variables")
-            def res_env() -> str:
-                keys = [
-                    "WINDOWS_MCP_INPUT_BACKEND",
-                    "WINDOWS_MCP_INPUT_DRIVER",
-                    "WINDOWS_MCP_RATE_MOVE_HZ",
-                    "WINDOWS_MCP_RATE_MAX_DELTA",
-                    "WINDOWS_MCP_RATE_SMOOTH",
-                    "WINDOWS_MCP_RATE_CPS",
-                    "WINDOWS_MCP_RATE_KPS",
-                    "WINDOWS_INPUT_LOG_LEVEL",
-                ]
-                lines = [f"{k}={os.getenv(k, '')}" for k in keys]
-                return "\n".join(lines)
+            for uri, name, description, fn in _RESOURCES:
+                mcp.resource(uri=uri, name=name, description=description)(fn)
         elif hasattr(mcp, "add_resource"):
             try:
-                mcp.add_resource(uri="mcp://windows/desktop-info", name="Desktop Info", mimeType="text/plain", value=desktop_info())
-                mcp.add_resource(uri="mcp://windows/active-window", name="Active Window", mimeType="text/plain", value=window_info())
-                mcp.add_resource(uri="mcp://windows/rate", name="Input Rate", mimeType="text/plain", value=input_info())
-                mcp.add_resource(uri="mcp://windows/instructions", name="Server Instructions", mimeType="text/plain", value=instructions)
-            except Exception:
-                pass
+                from fastmcp.resources import FunctionResource
+            except ImportError:
+                FunctionResource = None
+            for uri, name, description, fn in _RESOURCES:
+                try:
+                    if FunctionResource is not None:
+                        # Function-backed: fn runs on each read, never at import
+                        mcp.add_resource(FunctionResource(uri=uri, name=name, description=description, mime_type="text/plain", fn=fn))
+                    elif fn is res_instructions:
+                        mcp.add_resource(uri=uri, name=name, mimeType="text/plain", value=instructions)
+                    else:
+                        # Value-only add_resource (FastMCP builds without fastmcp.resources)
+                        # would freeze a live view at import, so these are not offered there
+                        logger.warning("Resource %s needs function-backed resources; not registered", uri)
+                except Exception as e:
+                    logger.debug("Resource %s registration skipped: %s", uri, e)
     except Exception as e:
         logger.debug("Resource registration skipped: %s", e)
 
@@ -279,41 +445,81 @@ _register_prompts_and_resources()
 
 
 def _get_cursor_pos() -> tuple[int, int]:
-    user32 = ctypes.windll.user32
-    class POINT(ctypes.Structure):
-        _fields_ = [("x", ctypes.c_long), ("y", ctypes.c_long)]
     pt = POINT()
-    user32.GetCursorPos(ctypes.byref(pt))
-    return int(pt.x), int(pt.y)
+    _GetCursorPos(ctypes.byref(pt))
+    return pt.x, pt.y
+
+
+MOVE_MAX_STEPS = 3000
+
+
+def _step_bound(src: tuple[int, int], dst: tuple[int, int], cfg: RateConfig) -> int:
+    """Steps filter_target needs from src to dst; exact without smoothing, capped otherwise."""
+    if cfg.mouse_smooth > 0:
+        return MOVE_MAX_STEPS  # geometric approach, no tight closed form
+    md = cfg.mouse_max_delta
+    if md <= 0:
+        return 1
+    dist = max(abs(dst[0] - src[0]), abs(dst[1] - src[1]))  # Chebyshev, axes clamp independently
+    return (dist + md - 1) // md
+
+
+def _plan_path(src: tuple[int, int], dst: tuple[int, int], step, max_steps: int = MOVE_MAX_STEPS) -> list[tuple[int, int]]:
+    """Precompute the waypoints from src to dst by replaying step (RateLimiter.filter_target)."""
+    cur = src
+    path: list[tuple[int, int]] = []
+    append = path.append
+    for _ in range(max_steps):
+        if cur == dst:
+            break
+        nxt = step(cur, dst)
+        if nxt == cur:
+            break  # smoothing stalled; final snap covers the rest
+        append(nxt)
+        cur = nxt
+    return path
+
+
+# Type-Tool's clipboard method hands larger texts (UTF-16 bytes) to send_text
+CLIPBOARD_MAX_BYTES = 1 << 20
+# Hard ceiling for anything placed on the clipboard
+CLIPBOARD_REJECT_BYTES = 64 << 20
 
 
 def _set_clipboard_text(text: str) -> bool:
     CF_UNICODETEXT = 13
-    user32 = ctypes.windll.user32
-    kernel32 = ctypes.windll.kernel32
-    if not user32.OpenClipboard(None):
+    # UTF-16 code units; characters outside the BMP take two
+    n = len(text)
+    if not text.isascii() and max(text) > '\uffff':
+        n += sum(1 for ch in text if ch > '\uffff')
+    if n * 2 > CLIPBOARD_REJECT_BYTES:
+        logger.error(f"Clipboard text too large: {n * 2} bytes (limit {CLIPBOARD_REJECT_BYTES})")
+        return False
+    if not _OpenClipboard(None):
         return False
     try:
-        if not user32.EmptyClipboard():
+        if not _EmptyClipboard():
             return False
-        data = text.encode('utf-16-le') + b"\x00\x00"
-        hGlobal = kernel32.GlobalAlloc(0x0002, len(data))  # GMEM_MOVEABLE
+        nbytes = (n + 1) * 2
+        hGlobal = _GlobalAlloc(0x0002, nbytes)  # GMEM_MOVEABLE
         if not hGlobal:
             return False
-        pchData = kernel32.GlobalLock(hGlobal)
+        pchData = _GlobalLock(hGlobal)
         if not pchData:
-            kernel32.GlobalFree(hGlobal)
+            _GlobalFree(hGlobal)
             return False
         try:
-            ctypes.memmove(pchData, data, len(data))
+            # Copy the str's wide-char form straight into the HGLOBAL, then terminate it
+            ctypes.memmove(pchData, ctypes.c_wchar_p(text), n * 2)
+            ctypes.memset(pchData + n * 2, 0, 2)
         finally:
-            kernel32.GlobalUnlock(hGlobal)
-        if not user32.SetClipboardData(CF_UNICODETEXT, hGlobal):
-            kernel32.GlobalFree(hGlobal)
+            _GlobalUnlock(hGlobal)
+        if not _SetClipboardData(CF_UNICODETEXT, hGlobal):
+            _GlobalFree(hGlobal)
             return False
         return True
     finally:
-        user32.CloseClipboard()
+        _CloseClipboard()
 
 
 def _parse_hwnd(value) -> int:
@@ -334,116 +540,136 @@ def _coerce_wh(value) -> tuple[int, int]:
     if isinstance(value, dict) and 'w' in value and 'h' in value:
         return int(value['w']), int(value['h'])
     if isinstance(value, str):
-        import re
-        nums = re.findall(r'-?\\d+', value)
+        # int() would accept "1_000", which the regex reads as separate numbers
+        parts = value.replace(',', ' ').split() if '_' not in value else ()
+        if len(parts) >= 2:
+            try:
+                return int(parts[0]), int(parts[1])
+            except ValueError:
+                pass
+        nums = _NUM_RE.findall(value)
         if len(nums) >= 2:
             return int(nums[0]), int(nums[1])
     raise ValueError("size must be [w,h] or {w,h}")
 
 
-# Common RECT structure to avoid duplication
-class RECT(ctypes.Structure):
-    _fields_ = [("left", ctypes.c_long), ("top", ctypes.c_long), ("right", ctypes.c_long), ("bottom", ctypes.c_long)]
+DWMWA_CLOAKED = 14
+# Titles are read into a fixed buffer; GetWindowTextLengthW sends WM_GETTEXTLENGTH
+# and can stall on a hung window, so longer titles are simply truncated
+TITLE_BUF_LEN = 512
+
+WinInfo = namedtuple('WinInfo', 'hwnd pid cls title left top right bottom visible minimized cloaked')
+
+
+_cloak_scratch = ctypes.c_int(0)
+_cloak_ptr = ctypes.byref(_cloak_scratch)
+_cloak_sz = ctypes.sizeof(_cloak_scratch)
+
+
+def _is_cloaked(hwnd) -> bool:
+    """DWM cloaking (occluded/hidden by OS)."""
+    try:
+        return not _DwmGetWindowAttribute(hwnd, DWMWA_CLOAKED, _cloak_ptr, _cloak_sz) and bool(_cloak_scratch.value)
+    except Exception:
+        return False
+
+
+def _enum_cb(hwnd, lparam):
+    # Enumeration state arrives through lparam so one callback serves every call
+    ctx = ctypes.cast(lparam, ctypes.POINTER(ctypes.py_object)).contents.value
+    try:
+        # Cheapest checks first; reject before any string/rect/pid fetch
+        visible = bool(_IsWindowVisible(hwnd))
+        if ctx['only_visible'] and not visible:
+            return True
+        minimized = bool(_IsIconic(hwnd))
+        if minimized and not ctx['include_minimized']:
+            return True
+        cloaked = _is_cloaked(hwnd)
+        if cloaked and not ctx['include_cloaked']:
+            return True
+        # Title: fixed buffer, longer titles are truncated
+        tbuf = ctx['title_buf']
+        _GetWindowTextW(hwnd, tbuf, TITLE_BUF_LEN)
+        title = tbuf.value
+        # Class
+        cbuf = ctx['cls_buf']
+        _GetClassNameW(hwnd, cbuf, 256)
+        cls = cbuf.value
+        # Filter before paying for the rect and the result row; the pid is
+        # only fetched early when a numeric query may need it
+        pid = ctx['pid']
+        q = ctx['query']
+        if q is not None and q not in title.lower() and q not in cls.lower():
+            if not ctx['q_is_digit']:
+                return True
+            _GetWindowThreadProcessId(hwnd, ctx['pid_ref'])
+            if q not in str(pid.value):
+                return True
+        else:
+            _GetWindowThreadProcessId(hwnd, ctx['pid_ref'])
+        pid_value = pid.value
+
+        # Rect
+        rc = ctx['rc']
+        _GetWindowRect(hwnd, ctx['rc_ref'])
+
+        item = WinInfo(hwnd, pid_value, cls, title, rc.left, rc.top, rc.right, rc.bottom, visible, minimized, cloaked)
+
+        results = ctx['results']
+        results.append(item)
+        limit = ctx['limit']
+        if limit is not None and len(results) >= limit:
+            return False  # stop enumeration
+    except Exception:
+        pass
+    return True
+
+
+_ENUM_CB = WNDENUMPROC(_enum_cb)
 
 
 def _enumerate_windows(
+    *,
     query: str | None = None,
     only_visible: bool = True,
     include_minimized: bool = True,
     include_cloaked: bool = True,
     limit: int | None = None,
     parent_hwnd: int | None = None,
-) -> list[dict]:
+) -> list[WinInfo]:
     """Common window enumeration logic shared by Windows-List and Windows-Select.
 
-    Returns a list of window info dictionaries with keys:
-    hwnd, pid, class, title, left, top, right, bottom, visible, minimized, cloaked
+    Returns a list of WinInfo tuples:
+    hwnd, pid, cls, title, left, top, right, bottom, visible, minimized, cloaked
     """
-    user32 = ctypes.windll.user32
-
-    EnumWindows = user32.EnumWindows
-    IsWindowVisible = user32.IsWindowVisible
-    IsIconic = user32.IsIconic
-    GetWindowTextLengthW = user32.GetWindowTextLengthW
-    GetWindowTextW = user32.GetWindowTextW
-    GetClassNameW = user32.GetClassNameW
-    GetWindowRect = user32.GetWindowRect
-    GetWindowThreadProcessId = user32.GetWindowThreadProcessId
-    EnumChildWindows = user32.EnumChildWindows
-
-    # DWM cloaking (occluded/hidden by OS)
-    cloaked_attr = 14  # DWMWA_CLOAKED
-    try:
-        dwmapi = ctypes.windll.dwmapi
-        DwmGetWindowAttribute = dwmapi.DwmGetWindowAttribute
-        def _is_cloaked(hwnd):
-            val = ctypes.c_int(0)
-            try:
-                DwmGetWindowAttribute(hwnd, cloaked_attr, ctypes.byref(val), ctypes.sizeof(val))
-                return bool(val.value)
-            except Exception:
-                return False
-    except Exception:
-        def _is_cloaked(hwnd):
-            return False
-
-    results: list[dict] = []
-
-    @ctypes.WINFUNCTYPE(ctypes.c_bool, wintypes.HWND, ctypes.c_void_p)
-    def _enum_proc(hwnd, lparam):
-        try:
-            visible = bool(IsWindowVisible(hwnd))
-            minimized = bool(IsIconic(hwnd))
-            cloaked = _is_cloaked(hwnd)
-            if only_visible and not visible:
-                return True
-            if minimized and not include_minimized:
-                return True
-            if cloaked and not include_cloaked:
-                return True
-            # Title
-            length = int(GetWindowTextLengthW(hwnd))
-            tbuf = ctypes.create_unicode_buffer(length + 1) if length > 0 else ctypes.create_unicode_buffer(1)
-            GetWindowTextW(hwnd, tbuf, len(tbuf))
-            title = tbuf.value
-            # Class
-            cbuf = ctypes.create_unicode_buffer(256)
-            GetClassNameW(hwnd, cbuf, 256)
-            cls = cbuf.value
-            # Rect
-            rc = RECT()
-            GetWindowRect(hwnd, ctypes.byref(rc))
-            # PID
-            pid = ctypes.c_ulong()
-            GetWindowThreadProcessId(hwnd, ctypes.byref(pid))
-
-            item = {
-                'hwnd': int(hwnd),
-                'pid': int(pid.value),
-                'class': cls,
-                'title': title,
-                'left': int(rc.left), 'top': int(rc.top), 'right': int(rc.right), 'bottom': int(rc.bottom),
-                'visible': visible,
-                'minimized': minimized,
-                'cloaked': cloaked,
-            }
-
-            q = (query or '').strip().lower()
-            if q:
-                if q not in (title or '').lower() and q not in (cls or '').lower() and q not in str(item['pid']):
-                    return True
-
-            results.append(item)
-            if limit is not None and len(results) >= int(limit):
-                return False  # stop enumeration
-        except Exception:
-            pass
-        return True
+    q = query.strip().lower() if query else None
+    results: list[WinInfo] = []
+    ctx = {
+        'query': q or None,
+        'q_is_digit': q.isdigit() if q else False,
+        'only_visible': only_visible,
+        'include_minimized': include_minimized,
+        'include_cloaked': include_cloaked,
+        'limit': int(limit) if limit is not None else None,
+        'results': results,
+    }
+    # Scratch structures reused for every HWND of this enumeration
+    rc = RECT()
+    pid = ctypes.c_ulong()
+    ctx.update(
+        rc=rc, rc_ref=ctypes.byref(rc),
+        pid=pid, pid_ref=ctypes.byref(pid),
+        cls_buf=ctypes.create_unicode_buffer(256),
+        title_buf=ctypes.create_unicode_buffer(TITLE_BUF_LEN),
+    )
+    ref = ctypes.py_object(ctx)  # keep alive for the duration of the enumeration
+    lparam = ctypes.cast(ctypes.pointer(ref), ctypes.c_void_p).value or 0
 
     if parent_hwnd is not None and int(parent_hwnd) != 0:
-        EnumChildWindows(wintypes.HWND(int(parent_hwnd)), _enum_proc, 0)
+        _EnumChildWindows(wintypes.HWND(int(parent_hwnd)), _ENUM_CB, lparam)
     else:
-        EnumWindows(_enum_proc, 0)
+        _EnumWindows(_ENUM_CB, lparam)
 
     return results
 
@@ -453,6 +679,7 @@ def _enumerate_windows(
     description="Return current backend info and rate limiter config."
 )
 def input_info() -> str:
+    backend = get_backend()
     info = backend.info()
     rcfg = rate.cfg
     return (
@@ -467,17 +694,16 @@ def input_info() -> str:
     description="Get virtual screen origin/size and monitor count."
 )
 def desktop_info() -> str:
-    user32 = ctypes.windll.user32
     SM_XVIRTUALSCREEN = 76
     SM_YVIRTUALSCREEN = 77
     SM_CXVIRTUALSCREEN = 78
     SM_CYVIRTUALSCREEN = 79
     SM_CMONITORS = 80
-    left = int(user32.GetSystemMetrics(SM_XVIRTUALSCREEN))
-    top = int(user32.GetSystemMetrics(SM_YVIRTUALSCREEN))
-    width = int(user32.GetSystemMetrics(SM_CXVIRTUALSCREEN))
-    height = int(user32.GetSystemMetrics(SM_CYVIRTUALSCREEN))
-    monitors = int(user32.GetSystemMetrics(SM_CMONITORS))
+    left = _GetSystemMetrics(SM_XVIRTUALSCREEN)
+    top = _GetSystemMetrics(SM_YVIRTUALSCREEN)
+    width = _GetSystemMetrics(SM_CXVIRTUALSCREEN)
+    height = _GetSystemMetrics(SM_CYVIRTUALSCREEN)
+    monitors = _GetSystemMetrics(SM_CMONITORS)
     return (
         f"VirtualScreen: left={left}, top={top}, width={width}, height={height}, monitors={monitors}"
     )
@@ -488,28 +714,24 @@ def desktop_info() -> str:
     description="Get active window title, class, and rect [l,t,r,b]."
 )
 def window_info() -> str:
-    user32 = ctypes.windll.user32
-    hwnd = user32.GetForegroundWindow()
+    hwnd = _GetForegroundWindow()
     if not hwnd:
         return "No active window."
     # Title
-    GetWindowTextLengthW = user32.GetWindowTextLengthW
-    GetWindowTextW = user32.GetWindowTextW
-    length = int(GetWindowTextLengthW(hwnd))
-    buf = ctypes.create_unicode_buffer(length + 1) if length > 0 else ctypes.create_unicode_buffer(1)
-    GetWindowTextW(hwnd, buf, len(buf))
+    buf = ctypes.create_unicode_buffer(TITLE_BUF_LEN)
+    _GetWindowTextW(hwnd, buf, TITLE_BUF_LEN)
     title = buf.value
     # Class
     bufc = ctypes.create_unicode_buffer(256)
-    user32.GetClassNameW(hwnd, bufc, 256)
+    _GetClassNameW(hwnd, bufc, 256)
     cls = bufc.value
     # Rect
     rc = RECT()
-    user32.GetWindowRect(hwnd, ctypes.byref(rc))
-    l, t, r, b = int(rc.left), int(rc.top), int(rc.right), int(rc.bottom)
+    _GetWindowRect(hwnd, ctypes.byref(rc))
+    l, t, r, b = rc.left, rc.top, rc.right, rc.bottom
     w, h = r - l, b - t
     return (
-        f"ActiveWindow: hwnd={int(hwnd)} title='{title}' class='{cls}' rect=[{l},{t},{r},{b}] size=[{w},{h}]"
+        f"ActiveWindow: hwnd={hwnd} title='{title}' class='{cls}' rect=[{l},{t},{r},{b}] size=[{w},{h}]"
     )
 
 
@@ -518,48 +740,32 @@ def window_info() -> str:
     description="Activate/bring window to front. Args: hwnd=int|hex, show='restore|minimize|maximize|show' (optional), topmost=bool (optional)."
 )
 def windows_activate(hwnd: int | str, show: str | None = None, topmost: bool | None = None) -> str:
-    user32 = ctypes.windll.user32
     target = _parse_hwnd(hwnd)
 
-    SW_RESTORE = 9
-    SW_SHOW = 5
-    SW_MINIMIZE = 6
-    SW_MAXIMIZE = 3
-
     # Show state first (if requested)
     if show:
-        m = show.strip().lower()
-        cmd = None
-        if m == 'restore': cmd = SW_RESTORE
-        elif m == 'show': cmd = SW_SHOW
-        elif m == 'minimize': cmd = SW_MINIMIZE
-        elif m == 'maximize': cmd = SW_MAXIMIZE
+        cmd = _SHOW_CMDS.get(show.strip().lower())
         if cmd is not None:
-            user32.ShowWindow(wintypes.HWND(target), int(cmd))
+            _ShowWindow(wintypes.HWND(target), cmd)
 
     # Try SetForegroundWindow; fallback to AttachThreadInput method
-    ok = bool(user32.SetForegroundWindow(wintypes.HWND(target)))
+    ok = bool(_SetForegroundWindow(wintypes.HWND(target)))
     if not ok:
-        fg = user32.GetForegroundWindow()
+        fg = _GetForegroundWindow()
         fg_tid = ctypes.c_ulong(0)
         tgt_tid = ctypes.c_ulong(0)
-        user32.GetWindowThreadProcessId(fg, ctypes.byref(fg_tid))
-        user32.GetWindowThreadProcessId(wintypes.HWND(target), ctypes.byref(tgt_tid))
+        _GetWindowThreadProcessId(fg, ctypes.byref(fg_tid))
+        _GetWindowThreadProcessId(wintypes.HWND(target), ctypes.byref(tgt_tid))
         try:
-            user32.AttachThreadInput(fg_tid.value, tgt_tid.value, True)
-            user32.BringWindowToTop(wintypes.HWND(target))
-            ok = bool(user32.SetForegroundWindow(wintypes.HWND(target)))
+            _AttachThreadInput(fg_tid.value, tgt_tid.value, True)
+            _BringWindowToTop(wintypes.HWND(target))
+            ok = bool(_SetForegroundWindow(wintypes.HWND(target)))
         finally:
-            user32.AttachThreadInput(fg_tid.value, tgt_tid.value, False)
+            _AttachThreadInput(fg_tid.value, tgt_tid.value, False)
 
     # Optional topmost toggle
     if topmost is not None:
-        HWND_TOPMOST = ctypes.c_void_p(-1)
-        HWND_NOTOPMOST = ctypes.c_void_p(-2)
-        SWP_NOMOVE = 0x0002
-        SWP_NOSIZE = 0x0001
-        SWP_SHOWWINDOW = 0x0040
-        user32.SetWindowPos(
+        _SetWindowPos(
             wintypes.HWND(target),
             HWND_TOPMOST if bool(topmost) else HWND_NOTOPMOST,
             0, 0, 0, 0,
@@ -568,8 +774,8 @@ def windows_activate(hwnd: int | str, show: str | None = None, topmost: bool | N
 
     # Return final rect
     rc = RECT()
-    user32.GetWindowRect(wintypes.HWND(target), ctypes.byref(rc))
-    l, t, r, b = int(rc.left), int(rc.top), int(rc.right), int(rc.bottom)
+    _GetWindowRect(wintypes.HWND(target), ctypes.byref(rc))
+    l, t, r, b = rc.left, rc.top, rc.right, rc.bottom
     w, h = r - l, b - t
     return f"Activate {'OK' if ok else 'TRY'} hwnd=0x{target:08X} rect=[{l},{t},{r},{b}] size=[{w},{h}] topmost={'on' if topmost else 'unchanged' if topmost is None else 'off'}"
 
@@ -584,15 +790,10 @@ def windows_setpos(
     size: list[int] | dict | str | None = None,
     z: str | None = None,
 ) -> str:
-    user32 = ctypes.windll.user32
     target = _parse_hwnd(hwnd)
     x = y = 0
     w = h = 0
     flags = 0
-    SWP_NOSIZE = 0x0001
-    SWP_NOMOVE = 0x0002
-    SWP_NOZORDER = 0x0004
-    SWP_SHOWWINDOW = 0x0040
 
     if loc is None:
         flags |= SWP_NOMOVE
@@ -603,24 +804,18 @@ def windows_setpos(
     else:
         w, h = _coerce_wh(size)
 
-    insert_after = ctypes.c_void_p(0)
+    insert_after = HWND_TOP
     if z:
-        zmap = {
-            'topmost': ctypes.c_void_p(-1),
-            'notopmost': ctypes.c_void_p(-2),
-            'top': ctypes.c_void_p(0),
-            'bottom': ctypes.c_void_p(1),
-        }
-        insert_after = zmap.get(z.strip().lower(), ctypes.c_void_p(0))
+        insert_after = _ZMAP.get(z.strip().lower(), HWND_TOP)
     else:
         flags |= SWP_NOZORDER
 
     flags |= SWP_SHOWWINDOW
-    ok = bool(user32.SetWindowPos(wintypes.HWND(target), insert_after, int(x), int(y), int(w), int(h), int(flags)))
+    ok = bool(_SetWindowPos(wintypes.HWND(target), insert_after, x, y, w, h, flags))
 
     rc = RECT()
-    user32.GetWindowRect(wintypes.HWND(target), ctypes.byref(rc))
-    l, t, r, b = int(rc.left), int(rc.top), int(rc.right), int(rc.bottom)
+    _GetWindowRect(wintypes.HWND(target), ctypes.byref(rc))
+    l, t, r, b = rc.left, rc.top, rc.right, rc.bottom
     return f"SetPos {'OK' if ok else 'FAIL'} hwnd=0x{target:08X} rect=[{l},{t},{r},{b}]"
 
 
@@ -629,13 +824,16 @@ def windows_setpos(
     description="Send WM_CLOSE to a window. Args: hwnd=int|hex."
 )
 def windows_close(hwnd: int | str) -> str:
-    user32 = ctypes.windll.user32
     target = _parse_hwnd(hwnd)
     WM_CLOSE = 0x0010
-    ok = bool(user32.PostMessageW(wintypes.HWND(target), WM_CLOSE, 0, 0))
+    ok = bool(_PostMessageW(wintypes.HWND(target), WM_CLOSE, 0, 0))
     return f"Close {'OK' if ok else 'FAIL'} hwnd=0x{target:08X}"
 
 
+# Windows-List row; the precision in the cls/title specs does the truncation
+_ROW_FMT = "{i:>3}  0x{hwnd:08X} {pid:>5} {flags} {cls:<20.20} {title:<30.30} [{l},{t},{r},{b}] {w}x{h}"
+
+
 @mcp.tool(
     name="Windows-List",
     description="Enumerate windows. Top-level via EnumWindows or children via EnumChildWindows when parent_hwnd is set. Filters: query, only_visible, include_minimized, include_cloaked, limit."
@@ -648,20 +846,25 @@ def windows_list(
     limit: int | None = None,
     parent_hwnd: int | None = None,
 ) -> str:
-    results = _enumerate_windows(query, only_visible, include_minimized, include_cloaked, limit, parent_hwnd)
+    results = _enumerate_windows(
+        query=query,
+        only_visible=only_visible,
+        include_minimized=include_minimized,
+        include_cloaked=include_cloaked,
+        limit=limit,
+        parent_hwnd=parent_hwnd,
+    )
 
     lines = [
         "idx  hwnd        pid   V M C  class                title                          rect[l,t,r,b]  size[w,h]",
         "---- ----------- ----- - - - -------------------- ------------------------------ -------------- ----------",
     ]
-    for i, it in enumerate(results):
-        l, t, r, b = it['left'], it['top'], it['right'], it['bottom']
-        w, h = r - l, b - t
-        lines.append(
-            f"{i:>3}  0x{it['hwnd']:08X} {it['pid']:>5} "
-            f"{ 'Y' if it['visible'] else '-' } { 'Y' if it['minimized'] else '-' } { 'Y' if it['cloaked'] else '-' } "
-            f"{it['class'][:20]:<20} {(it['title'] or '')[:30]:<30} [{l},{t},{r},{b}] {w}x{h}"
-        )
+    append = lines.append
+    fmt = _ROW_FMT.format
+    for i, (hwnd, pid, cls, title, l, t, r, b, visible, minimized, cloaked) in enumerate(results):
+        flags = ('Y' if visible else '-') + (' Y' if minimized else ' -') + (' Y' if cloaked else ' -')
+        append(fmt(i=i, hwnd=hwnd, pid=pid, flags=flags, cls=cls, title=title or '',
+                   l=l, t=t, r=r, b=b, w=r - l, h=b - t))
     if not results:
         lines.append("(no windows matched)")
     return "\n".join(lines)
@@ -679,7 +882,16 @@ def windows_select(
     index: int | None = None,
     parent_hwnd: int | None = None,
 ) -> str:
-    results = _enumerate_windows(query, only_visible, include_minimized, include_cloaked, limit=None, parent_hwnd=parent_hwnd)
+    # Matches are counted after filtering, so enumeration can stop at the requested one
+    need = max(int(index), 0) + 1 if index is not None else 1
+    results = _enumerate_windows(
+        query=query,
+        only_visible=only_visible,
+        include_minimized=include_minimized,
+        include_cloaked=include_cloaked,
+        limit=need,
+        parent_hwnd=parent_hwnd,
+    )
 
     if not results:
         return "No windows matched."
@@ -692,11 +904,11 @@ def windows_select(
     else:
         it = results[0]
 
-    l, t, r, b = it['left'], it['top'], it['right'], it['bottom']
+    l, t, r, b = it.left, it.top, it.right, it.bottom
     w, h = r - l, b - t
     return (
-        f"Selected hwnd=0x{it['hwnd']:08X} pid={it['pid']} visible={it['visible']} minimized={it['minimized']} cloaked={it['cloaked']}"
-        f" class='{it['class']}' title='{it['title']}' rect=[{l},{t},{r},{b}] size=[{w},{h}]"
+        f"Selected hwnd=0x{it.hwnd:08X} pid={it.pid} visible={it.visible} minimized={it.minimized} cloaked={it.cloaked}"
+        f" class='{it.cls}' title='{it.title}' rect=[{l},{t},{r},{b}] size=[{w},{h}]"
     )
 
 
@@ -705,21 +917,51 @@ def windows_select(
     description="Move cursor to coordinates. Format: to_loc=[x,y] or 'x,y'. Uses stepwise movement under rate limits."
 )
 def move_tool(to_loc: list[int] | dict | str) -> str:
+    # Locals rather than default-arg binding so FastMCP's schema only sees to_loc
+    _backend = get_backend()
+    _rate = rate
     try:
         tx, ty = _coerce_xy(to_loc)
-        logger.debug(f"Moving cursor to ({tx},{ty})")
-        # Step toward target using RateLimiter
-        for _ in range(3000):  # hard cap
+        if _DEBUG_LOG:
+            logger.debug(f"Moving cursor to ({tx},{ty})")
+        if MOUSE_AUTHORITATIVE:
             cx, cy = _get_cursor_pos()
-            if (cx, cy) == (tx, ty):
-                break
-            nx, ny = rate.filter_target((cx, cy), (tx, ty))
-            rate.sleep_until_ready("move")
-            backend.move(nx, ny)
-            if (nx, ny) == (tx, ty):
+            path = _plan_path((cx, cy), (tx, ty), _rate.filter_target, _step_bound((cx, cy), (tx, ty), _rate.cfg))
+            if path:
+                # One backend call paces the whole path at the move rate; book every
+                # point so later moves stay spaced as if sent one by one
+                _rate.consume("move", len(path))
+                _backend.move_batch(path, _rate.min_interval('move'))
+            if _get_cursor_pos() != (tx, ty):
                 # final snap if needed
-                backend.move(tx, ty)
+                _backend.move(tx, ty)
+            return f"Moved to ({tx},{ty})."
+        # Step toward target using RateLimiter
+        pt = POINT()
+        pt_ref = ctypes.byref(pt)
+        get_pos = _GetCursorPos
+        step = _rate.filter_target
+        wait = _rate.sleep_until_ready
+        mv = _backend.move
+        target = (tx, ty)
+        # The observed cursor may lag or drift, so the closed-form step count is not
+        # authoritative here; MOVE_MAX_STEPS only guards against a runaway loop.
+        for _ in range(MOVE_MAX_STEPS):
+            get_pos(pt_ref)
+            cx, cy = pt.x, pt.y
+            if cx == tx and cy == ty:
+                break
+            nx, ny = step((cx, cy), target)
+            if nx == cx and ny == cy:
+                break  # smoothing stalled; final snap covers the rest
+            wait("move")
+            mv(nx, ny)
+            if nx == tx and ny == ty:
                 break
+        get_pos(pt_ref)
+        if pt.x != tx or pt.y != ty:
+            # final snap if needed
+            mv(tx, ty)
         return f"Moved to ({tx},{ty})."
     except ValueError as e:
         logger.error(f"Invalid move location format: {e}")
@@ -734,10 +976,14 @@ def move_tool(to_loc: list[int] | dict | str) -> str:
     description="Click at coordinates. Format: loc=[x,y], button='left|right|middle', clicks=int."
 )
 def click_tool(loc: list[int] | dict | str, button: Literal['left', 'right', 'middle'] = 'left', clicks: int = 1) -> str:
+    backend = get_backend()
     try:
         x, y = _coerce_xy(loc)
-        num_clicks = int(max(1, clicks))
-        logger.debug(f"Clicking {button} button x{num_clicks} at ({x},{y})")
+        num_clicks = clicks if type(clicks) is int and clicks >= 1 else max(1, int(clicks))
+        if button not in _BTNS:
+            button = str(button).lower()
+        if _DEBUG_LOG:
+            logger.debug(f"Clicking {button} button x{num_clicks} at ({x},{y})")
         rate.sleep_until_ready("click")
         backend.click(x, y, button=button, clicks=num_clicks)
         return f"{button} click x{num_clicks} at ({x},{y})."
@@ -754,6 +1000,7 @@ def click_tool(loc: list[int] | dict | str, button: Literal['left', 'right', 'mi
     description="Drag from from_loc to to_loc. Format: from_loc=[x,y], to_loc=[x,y]."
 )
 def drag_tool(from_loc: list[int] | dict | str, to_loc: list[int] | dict | str) -> str:
+    backend = get_backend()
     x1, y1 = _coerce_xy(from_loc)
     x2, y2 = _coerce_xy(to_loc)
     backend.drag(x1, y1, x2, y2)
@@ -765,13 +1012,21 @@ def drag_tool(from_loc: list[int] | dict | str, to_loc: list[int] | dict | str)
     description="Type text. method='unicode'|'clipboard'|'vk'. unicode uses KEYEVENTF_UNICODE; clipboard sets text then 'ctrl+v'; vk simulates per-char key events."
 )
 def type_tool(text: str, method: Literal['unicode', 'clipboard', 'vk'] = 'unicode', press_enter: bool = False) -> str:
+    backend = get_backend()
     if not isinstance(text, str):
         logger.error("Type-Tool received non-string text")
         raise ValueError("text must be a string")
     try:
-        m = (method or 'unicode').lower()
-        logger.debug(f"Typing {len(text)} characters via {m} method")
-        if m == 'clipboard':
+        m = method if method in _METHODS else (method or 'unicode').lower()
+        n = len(text)
+        if _DEBUG_LOG:
+            logger.debug(f"Typing {n} characters via {m} method")
+        if m == 'clipboard' and n * 2 > CLIPBOARD_MAX_BYTES:
+            # Huge clipboard payloads stall the target app on paste; type it instead
+            logger.info(f"Text exceeds {CLIPBOARD_MAX_BYTES} bytes, sending via unicode instead of clipboard")
+            rate.sleep_until_ready('key')
+            backend.send_text(text)
+        elif m == 'clipboard':
             ok = _set_clipboard_text(text)
             if not ok:
                 logger.error("Failed to set clipboard text")
@@ -779,21 +1034,22 @@ def type_tool(text: str, method: Literal['unicode', 'clipboard', 'vk'] = 'unicod
             rate.sleep_until_ready('key')
             backend.hotkey('ctrl+v')
         elif m == 'vk':
-            # Emit via key_down/up using keyboard mapping; safer for some games
-            for ch in text:
-                rate.sleep_until_ready('key')
-                backend.key_down(ch)
-                backend.key_up(ch)
+            # Virtual-key presses using the keyboard mapping; safer for some games.
+            # Rate-limited once, the backend batches the key events.
+            rate.sleep_until_ready('key')
+            backend.send_text_batch(text)
         else:
-            # Default unicode path - send entire text to backend
-            # Backend now handles character-by-character sending with proper delays
-            # No need to chunk here, backend.send_text has built-in delays
+            # Default unicode path - send entire text to backend in one go.
+            # Pure-ASCII text only skips KEYEVENTF_UNICODE when WINDOWS_MCP_ASCII_VK opts in.
             rate.sleep_until_ready('key')
-            backend.send_text(text)
+            if text.isascii():
+                backend.send_text_ascii(text)
+            else:
+                backend.send_text(text)
         if press_enter:
             rate.sleep_until_ready('key')
             backend.hotkey('enter')
-        return f"Typed {len(text)} chars via {m}."
+        return f"Typed {n} chars via {m}."
     except Exception as e:
         logger.error(f"Type operation failed: {e}")
         raise
@@ -804,11 +1060,13 @@ def type_tool(text: str, method: Literal['unicode', 'clipboard', 'vk'] = 'unicod
     description="Send a keyboard shortcut, e.g., 'ctrl+c', 'win+r', 'shift+tab'."
 )
 def shortcut_tool(shortcut: str) -> str:
+    backend = get_backend()
     if not isinstance(shortcut, str) or not shortcut:
         logger.error("Shortcut-Tool received invalid shortcut")
         raise ValueError("shortcut must be a non-empty string, e.g., 'ctrl+c'")
     try:
-        logger.debug(f"Sending keyboard shortcut: {shortcut}")
+        if _DEBUG_LOG:
+            logger.debug(f"Sending keyboard shortcut: {shortcut}")
         rate.sleep_until_ready("key")
         backend.hotkey(shortcut)
         return f"Shortcut sent: {shortcut}"
@@ -828,7 +1086,8 @@ def key_tool(
     interval_ms: int = 40,
     hold_ms: int = 0,
 ) -> str:
-    m = (mode or 'tap').lower()
+    backend = get_backend()
+    m = mode if mode in _KEY_MODES else (mode or 'tap').lower()
     n = max(1, int(times))
     iv = max(0, int(interval_ms)) / 1000.0
     if m == 'down':
@@ -843,20 +1102,20 @@ def key_tool(
         rate.sleep_until_ready('key')
         backend.key_down(key)
         try:
-            import time
-            time.sleep(max(0, int(hold_ms)) / 1000.0)
+            _sleep(max(0, int(hold_ms)) / 1000.0)
         finally:
             backend.key_up(key)
         return f"Key hold: {key} {max(0, int(hold_ms))}ms"
-    # tap
-    import time
-    for _ in range(n):
-        rate.sleep_until_ready('key')
-        backend.key_down(key)
-        time.sleep(max(0.0, min(0.25, iv)))
-        backend.key_up(key)
-        if iv > 0:
-            time.sleep(iv)
+    # tap: the backend paces the whole sequence. Taps that fit in the key burst may go
+    # back to back; longer runs are never closer than the key rate.
+    hold = min(0.25, iv)
+    if n <= rate.cfg.burst_keys:
+        gap = iv
+    else:
+        gap = max(iv, rate.min_interval('key') - hold)
+    # Like Combo-Tool: rate-limit once, charging every tap to the bucket
+    rate.consume('key', n)
+    backend.tap_sequence(key, n, gap, hold)
     return f"Key tap: {key} x{n}"
 
 
@@ -865,17 +1124,16 @@ def key_tool(
     description="Hold multiple keys together like human combos. keys=['shift','w'], hold_ms=600. Releases in reverse order."
 )
 def combo_tool(keys: list[str], hold_ms: int = 300) -> str:
+    backend = get_backend()
     if not isinstance(keys, list) or not keys:
         raise ValueError("keys must be a non-empty list of strings")
-    import time
+    # A combo is one action: rate-limit once, charging every key to the bucket
+    rate.consume('key', len(keys))
     # Press in order
-    for k in keys:
-        rate.sleep_until_ready('key')
-        backend.key_down(k)
-    time.sleep(max(0, int(hold_ms)) / 1000.0)
+    backend.press_keys(keys)
+    _sleep(max(0, int(hold_ms)) / 1000.0)
     # Release in reverse
-    for k in reversed(keys):
-        backend.key_up(k)
+    backend.release_keys(keys[::-1])
     return f"Combo {keys} held {int(hold_ms)}ms"
 
 
@@ -889,15 +1147,17 @@ def scroll_tool(
     direction: Literal['up', 'down', 'left', 'right'] = 'down',
     wheel_times: int = 1,
 ) -> str:
+    backend = get_backend()
     if loc is not None:
         x, y = _coerce_xy(loc)
         backend.move(x, y)
     # Use backend-provided scroll to keep driver/OS-level semantics
-    backend.scroll(int(max(1, wheel_times)), type, direction)
+    times = max(1, int(wheel_times))
+    backend.scroll(times, type, direction)
     pos = ""
     if loc is not None:
         pos = f" at ({x},{y})"
-    return f"Scrolled {type} {direction} x{int(max(1, wheel_times))}{pos}."
+    return f"Scrolled {type} {direction} x{times}{pos}."
 
 
 @mcp.tool(
@@ -924,6 +1184,7 @@ def rate_config(
     cfg.mouse_smooth = max(0.0, min(0.98, _num(smooth, cfg.mouse_smooth, float)))
     cfg.clicks_per_sec = max(1.0, min(60.0, _num(cps, cfg.clicks_per_sec, float)))
     cfg.keys_per_sec = max(1.0, min(60.0, _num(kps, cfg.keys_per_sec, float)))
+    rate._recompute()
     return (
         f"rate(move_hz={cfg.mouse_move_hz}, max_delta={cfg.mouse_max_delta}, smooth={cfg.mouse_smooth}, "
         f"cps={cfg.clicks_per_sec}, kps={cfg.keys_per_sec})"
@@ -1,6 +1,7 @@
 from __future__ import annotations
+from array import array
 from dataclasses import dataclass
-from time import monotonic, sleep
+from time import perf_counter_ns, sleep
 
 
 @dataclass
@@ -10,44 +11,80 @@ class RateConfig:
     mouse_smooth: float = 0.0
     clicks_per_sec: float = 8.0
     keys_per_sec: float = 12.0
+    # Token-bucket capacity per kind: events admitted back to back before spacing kicks in
+    burst_clicks: int = 1
+    burst_keys: int = 1
+    burst_moves: int = 1
+
+
+# Per-kind state lives in parallel arrays indexed by these slots
+_KIND = {'click': 0, 'key': 1, 'move': 2}
+# Which "active" flag each kind raises while it waits
+_ACTIVE = ('_mouse_active', '_keyboard_active', '_mouse_active')
 
 
 class RateLimiter:
     def __init__(self, cfg: RateConfig | None = None):
         self.cfg = cfg or RateConfig()
-        self._last_click = 0.0
-        self._last_key = 0.0
-        self._last_move = 0.0
+        # Token buckets kept as GCRA in integer nanoseconds: _tat is each kind's
+        # theoretical arrival time, an event may go once now >= _tat - _tau
+        self._tat = array('q', (0, 0, 0))
+        self._interval_ns = array('q', (0, 0, 0))
+        self._tau_ns = array('q', (0, 0, 0))
         # Separate tracking for mouse and keyboard to prevent interference
         self._mouse_active = False
         self._keyboard_active = False
+        self._recompute()
+        self._now = perf_counter_ns
+        self._sleep = sleep
 
     def update_config(self, cfg: RateConfig):
         self.cfg = cfg
+        self._recompute()
+
+    def _recompute(self):
+        """Refresh the cached intervals and burst allowances; call after mutating cfg in place."""
+        cfg = self.cfg
+        rates = (cfg.clicks_per_sec, cfg.keys_per_sec, cfg.mouse_move_hz)
+        caps = (cfg.burst_clicks, cfg.burst_keys, cfg.burst_moves)
+        for i in range(3):
+            interval = int(1e9 / max(rates[i], 0.001))
+            self._interval_ns[i] = interval
+            self._tau_ns[i] = (max(1, caps[i]) - 1) * interval
+        # None means smoothing is off and filter_target skips the multiply
+        s = cfg.mouse_smooth
+        self._smooth_keep = 1.0 - s if s > 0 else None
+
+    def min_interval(self, kind: str) -> float:
+        """Steady-state seconds between two events of kind."""
+        return self._interval_ns[_KIND[kind]] * 1e-9
+
+    def _time_until(self, i: int) -> float:
+        remaining_ns = self._tat[i] - self._tau_ns[i] - self._now()
+        return remaining_ns * 1e-9 if remaining_ns > 0 else 0.0
+
+    def _mark(self, i: int):
+        now = self._now()
+        tat = self._tat[i]
+        self._tat[i] = (tat if tat > now else now) + self._interval_ns[i]
 
     def time_until_click(self) -> float:
-        min_dt = 1.0 / max(self.cfg.clicks_per_sec, 0.001)
-        dt = monotonic() - self._last_click
-        return max(0.0, min_dt - dt)
+        return self._time_until(0)
 
     def mark_click(self):
-        self._last_click = monotonic()
+        self._mark(0)
 
     def time_until_key(self) -> float:
-        min_dt = 1.0 / max(self.cfg.keys_per_sec, 0.001)
-        dt = monotonic() - self._last_key
-        return max(0.0, min_dt - dt)
+        return self._time_until(1)
 
     def mark_key(self):
-        self._last_key = monotonic()
+        self._mark(1)
 
     def time_until_move(self) -> float:
-        min_dt = 1.0 / max(self.cfg.mouse_move_hz, 0.001)
-        dt = monotonic() - self._last_move
-        return max(0.0, min_dt - dt)
+        return self._time_until(2)
 
     def mark_move(self):
-        self._last_move = monotonic()
+        self._mark(2)
 
     def filter_target(self, cur: tuple[int, int], target: tuple[int, int]) -> tuple[int, int]:
         cx, cy = cur
@@ -55,36 +92,37 @@ class RateLimiter:
         dx, dy = tx - cx, ty - cy
         md = self.cfg.mouse_max_delta
         if md > 0:
-            if abs(dx) > md: dx = md if dx > 0 else -md
-            if abs(dy) > md: dy = md if dy > 0 else -md
-        s = self.cfg.mouse_smooth
-        if s > 0:
-            dx = int(dx * (1.0 - s))
-            dy = int(dy * (1.0 - s))
+            dx = md if dx > md else -md if dx < -md else dx
+            dy = md if dy > md else -md if dy < -md else dy
+        k = self._smooth_keep
+        if k is not None:
+            dx = int(dx * k)
+            dy = int(dy * k)
         return cx + dx, cy + dy
 
+    def consume(self, kind: str, n: int = 1):
+        """sleep_until_ready for a batch of n events sent at once.
+
+        Waits for one slot, then books the other n - 1 so the events after
+        the batch are spaced as if it had been sent one by one.
+        """
+        self.sleep_until_ready(kind)
+        i = _KIND.get(kind)
+        if n > 1 and i is not None:
+            self._tat[i] += (n - 1) * self._interval_ns[i]
+
     def sleep_until_ready(self, kind: str):
         """Sleep until the next input event can be sent, with collision detection.
 
         Prevents mouse and keyboard events from interfering with each other
         by tracking active input types.
         """
-        if kind == 'click':
-            self._mouse_active = True
-            t = self.time_until_click();
-            if t > 0: sleep(t)
-            self.mark_click()
-            self._mouse_active = False
-        elif kind == 'key':
-            self._keyboard_active = True
-            t = self.time_until_key();
-            if t > 0: sleep(t)
-            self.mark_key()
-            self._keyboard_active = False
-        elif kind == 'move':
-            self._mouse_active = True
-            t = self.time_until_move();
-            if t > 0: sleep(t)
-            self.mark_move()
-            self._mouse_active = False
-
+        i = _KIND.get(kind)
+        if i is None:
+            return
+        active = _ACTIVE[i]
+        setattr(self, active, True)
+        t = self._time_until(i)
+        if t > 0: self._sleep(t)
+        self._mark(i)
+        setattr(self, active, False)
@@ -0,0 +1,50 @@
+import sys
+
+import pytest
+
+if sys.platform != "win32":
+    pytest.skip("main binds Win32 APIs at import", allow_module_level=True)
+pytest.importorskip("fastmcp")
+
+import main
+
+
+@pytest.mark.parametrize(
+    "value, expected",
+    [
+        ([800, 600], (800, 600)),
+        ((800, 600), (800, 600)),
+        (["800", "600"], (800, 600)),
+        ({"x": 10, "y": -20}, (10, -20)),
+        ("800,600", (800, 600)),
+        ("800 600", (800, 600)),
+        (" 800 , 600 ", (800, 600)),
+        ("-5,-7", (-5, -7)),
+        ("[800, 600]", (800, 600)),
+        ("x=12 y=34", (12, 34)),
+        ("1.5 2", (1, 5)),
+        ("1_000 2", (1, 0)),
+    ],
+)
+def test_coerce_xy(value, expected):
+    assert main._coerce_xy(value) == expected
+
+
+@pytest.mark.parametrize("value", [[1], [1, 2, 3], {"x": 1}, "", "12", None, 5])
+def test_coerce_xy_rejects(value):
+    with pytest.raises(ValueError):
+        main._coerce_xy(value)
+
+
+@pytest.mark.parametrize(
+    "value, expected",
+    [
+        ([640, 480], (640, 480)),
+        ({"w": 640, "h": 480}, (640, 480)),
+        ("640x480", (640, 480)),
+        ("640,480", (640, 480)),
+        ("1_000 2", (1, 0)),
+    ],
+)
+def test_coerce_wh(value, expected):
+    assert main._coerce_wh(value) == expected
@@ -0,0 +1,46 @@
+import sys
+
+import pytest
+
+if sys.platform != "win32":
+    pytest.skip("main binds Win32 APIs at import", allow_module_level=True)
+pytest.importorskip("fastmcp")
+
+import main
+from rate import RateConfig, RateLimiter
+
+
+@pytest.mark.parametrize("dst", [(1000, -300), (-7, 3), (61, 0)])
+def test_plan_path_reaches_target(dst):
+    limiter = RateLimiter(RateConfig(mouse_max_delta=60))
+    path = main._plan_path((0, 0), dst, limiter.filter_target)
+    assert path[-1] == dst
+    assert all(max(abs(b[0] - a[0]), abs(b[1] - a[1])) <= 60 for a, b in zip([(0, 0)] + path, path))
+
+
+def test_plan_path_empty_when_already_there():
+    limiter = RateLimiter(RateConfig())
+    assert main._plan_path((5, 5), (5, 5), limiter.filter_target) == []
+
+
+def test_plan_path_stops_when_smoothing_stalls():
+    limiter = RateLimiter(RateConfig(mouse_max_delta=60, mouse_smooth=0.5))
+    path = main._plan_path((0, 0), (1000, -300), limiter.filter_target)
+    assert path
+    last = path[-1]
+    assert last == (1000, -300) or limiter.filter_target(last, (1000, -300)) == last
+
+
+@pytest.mark.parametrize("dst", [(0, 0), (1000, -300), (-7, 3), (60, 0), (61, 0)])
+def test_step_bound_is_exact_without_smoothing(dst):
+    cfg = RateConfig(mouse_max_delta=60)
+    limiter = RateLimiter(cfg)
+    bound = main._step_bound((0, 0), dst, cfg)
+    path = main._plan_path((0, 0), dst, limiter.filter_target, bound)
+    assert len(path) == bound
+    assert (path[-1] if path else (0, 0)) == dst
+
+
+def test_step_bound_caps_smoothed_and_unclamped_moves():
+    assert main._step_bound((0, 0), (5000, 0), RateConfig(mouse_smooth=0.5)) == main.MOVE_MAX_STEPS
+    assert main._step_bound((0, 0), (5000, 0), RateConfig(mouse_max_delta=0)) == 1
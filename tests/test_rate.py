@@ -0,0 +1,140 @@
+import pytest
+
+from rate import RateConfig, RateLimiter
+
+
+class FakeClock:
+    """Deterministic stand-in for perf_counter_ns/sleep; sleeping advances the clock."""
+
+    def __init__(self):
+        self.now_ns = 10**12
+        self.sleeps: list[float] = []
+
+    def now(self) -> int:
+        return self.now_ns
+
+    def sleep(self, seconds: float):
+        self.sleeps.append(seconds)
+        self.now_ns += round(seconds * 1e9)
+
+
+def make_limiter(**cfg) -> tuple[RateLimiter, FakeClock]:
+    limiter = RateLimiter(RateConfig(**cfg))
+    clock = FakeClock()
+    limiter._now = clock.now
+    limiter._sleep = clock.sleep
+    return limiter, clock
+
+
+def test_events_are_spaced_by_the_rate():
+    limiter, clock = make_limiter(keys_per_sec=10.0)
+    limiter.sleep_until_ready('key')
+    assert clock.sleeps == []
+    limiter.sleep_until_ready('key')
+    limiter.sleep_until_ready('key')
+    assert clock.sleeps == [pytest.approx(0.1), pytest.approx(0.1)]
+
+
+def test_idle_time_is_not_banked_without_burst():
+    limiter, clock = make_limiter(keys_per_sec=10.0)
+    limiter.sleep_until_ready('key')
+    clock.now_ns += 5 * 10**9
+    limiter.sleep_until_ready('key')
+    limiter.sleep_until_ready('key')
+    assert clock.sleeps == [pytest.approx(0.1)]
+
+
+def test_burst_admits_events_back_to_back():
+    limiter, clock = make_limiter(keys_per_sec=10.0, burst_keys=3)
+    for _ in range(3):
+        limiter.sleep_until_ready('key')
+    assert clock.sleeps == []
+    limiter.sleep_until_ready('key')
+    assert clock.sleeps == [pytest.approx(0.1)]
+
+
+def test_mark_then_wait():
+    limiter, _ = make_limiter(clicks_per_sec=8.0)
+    limiter.mark_click()
+    assert limiter.time_until_click() == pytest.approx(0.125)
+
+
+def test_min_interval_follows_rate():
+    limiter, _ = make_limiter(keys_per_sec=10.0, clicks_per_sec=4.0, mouse_move_hz=100.0)
+    assert limiter.min_interval('key') == pytest.approx(0.1)
+    assert limiter.min_interval('click') == pytest.approx(0.25)
+    assert limiter.min_interval('move') == pytest.approx(0.01)
+
+
+def test_kinds_have_independent_buckets():
+    limiter, clock = make_limiter(keys_per_sec=10.0, clicks_per_sec=10.0)
+    limiter.sleep_until_ready('key')
+    limiter.sleep_until_ready('click')
+    assert clock.sleeps == []
+    assert limiter.time_until_key() == pytest.approx(0.1)
+    assert limiter.time_until_move() == 0.0
+
+
+def test_unknown_kind_is_ignored():
+    limiter, clock = make_limiter()
+    limiter.sleep_until_ready('scroll')
+    limiter.consume('scroll', 5)
+    assert clock.sleeps == []
+
+
+def test_update_config_refreshes_intervals():
+    limiter, _ = make_limiter(keys_per_sec=10.0)
+    limiter.update_config(RateConfig(keys_per_sec=4.0))
+    assert limiter.min_interval('key') == pytest.approx(0.25)
+
+
+def test_consume_books_the_whole_batch():
+    limiter, clock = make_limiter(keys_per_sec=10.0)
+    limiter.consume('key', 4)
+    assert clock.sleeps == []
+    limiter.sleep_until_ready('key')
+    assert clock.sleeps == [pytest.approx(0.4)]
+
+
+def test_consume_single_matches_sleep_until_ready():
+    a, clock_a = make_limiter(keys_per_sec=10.0)
+    b, clock_b = make_limiter(keys_per_sec=10.0)
+    for _ in range(3):
+        a.consume('key')
+        b.sleep_until_ready('key')
+    assert clock_a.sleeps == clock_b.sleeps
+
+
+def test_filter_target_clamps_each_axis():
+    limiter = RateLimiter(RateConfig(mouse_max_delta=60))
+    assert limiter.filter_target((0, 0), (500, -10)) == (60, -10)
+    assert limiter.filter_target((0, 0), (-500, 500)) == (-60, 60)
+    assert limiter.filter_target((5, 5), (5, 5)) == (5, 5)
+
+
+def test_filter_target_without_clamp():
+    limiter = RateLimiter(RateConfig(mouse_max_delta=0))
+    assert limiter.filter_target((0, 0), (1234, -987)) == (1234, -987)
+
+
+@pytest.mark.parametrize('smooth', [0.2, 0.3, 0.5, 0.7, 0.98])
+def test_filter_target_smoothing_truncates_like_int(smooth):
+    limiter = RateLimiter(RateConfig(mouse_max_delta=60, mouse_smooth=smooth))
+    for d in range(-80, 81):
+        step = max(-60, min(60, d))
+        expected = int(step * (1.0 - smooth))
+        assert limiter.filter_target((100, 100), (100 + d, 100 - d)) == (100 + expected, 100 - expected)
+
+
+def test_filter_target_smoothing_examples():
+    limiter = RateLimiter(RateConfig(mouse_max_delta=60, mouse_smooth=0.2))
+    assert limiter.filter_target((0, 0), (-60, 60)) == (-48, 48)
+    limiter.cfg.mouse_smooth = 0.3
+    limiter._recompute()
+    assert limiter.filter_target((0, 0), (10, -10)) == (int(10 * 0.7), int(-10 * 0.7))
+
+
+def test_update_config_refreshes_smoothing():
+    limiter = RateLimiter(RateConfig())
+    limiter.update_config(RateConfig(mouse_smooth=0.5))
+    assert limiter.filter_target((0, 0), (10, 10)) == (5, 5)